@@ -0,0 +1,192 @@
+"""Encrypted storage for Xiaohongshu account credentials.
+
+Credentials are encrypted with a key derived from a master password and
+kept in a JSON file next to the application.
+"""
+
+import base64
+import hmac
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+
+class AccountEncryption:
+    """Derives the store key from the master password and en/decrypts."""
+
+    KDF_ITERATIONS = 480000
+
+    NONCE_SIZE = 12
+
+    def __init__(self, salt_path='xhs_salt.bin'):
+        self.salt_path = Path(salt_path)
+        self._derived_key = None
+        # One AESGCM instance per key: the constructor runs the key
+        # schedule, so per-record decrypts hit the AES-NI fast path.
+        self._aead = None
+        # Built lazily, only to read tokens from pre-GCM stores.
+        self._fernet = None
+        self._verifier_tag = None
+
+    def _get_salt(self):
+        if self.salt_path.exists():
+            return self.salt_path.read_bytes()
+        salt = os.urandom(16)
+        self.salt_path.write_bytes(salt)
+        return salt
+
+    def derive_key(self, password):
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32,
+                         salt=self._get_salt(),
+                         iterations=self.KDF_ITERATIONS)
+        return kdf.derive(password)
+
+    def set_master_password(self, password):
+        """Run the KDF and arm the cipher; raises on wrong password."""
+        key = self.derive_key(password.encode('utf-8'))
+        self._derived_key = key
+        self._aead = AESGCM(key)
+        self._fernet = None
+        self._verifier_tag = hmac.new(key, b'verify', 'sha256').digest()
+
+    def verify_fast(self, key):
+        """Check a previously derived key without re-running the KDF."""
+        if self._verifier_tag is None or key is None:
+            return False
+        return hmac.compare_digest(
+            self._verifier_tag, hmac.new(key, b'verify', 'sha256').digest())
+
+    def encrypt(self, plaintext):
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self._aead.encrypt(nonce, plaintext.encode('utf-8'),
+                                        None)
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode('ascii')
+
+    def decrypt(self, token):
+        raw = base64.urlsafe_b64decode(token.encode('ascii'))
+        try:
+            return self._aead.decrypt(raw[:self.NONCE_SIZE],
+                                      raw[self.NONCE_SIZE:],
+                                      None).decode('utf-8')
+        except InvalidTag:
+            return self._legacy_decrypt(token)
+
+    def _legacy_decrypt(self, token):
+        """Read tokens written by the old Fernet-based store."""
+        if self._fernet is None:
+            self._fernet = Fernet(
+                base64.urlsafe_b64encode(self._derived_key))
+        return self._fernet.decrypt(token.encode('ascii')).decode('utf-8')
+
+
+class AccountManager:
+    """CRUD over the encrypted XHS account store."""
+
+    def __init__(self, accounts_path='xhs_accounts.json'):
+        self.accounts_file = Path(accounts_path)
+        self.encryption = AccountEncryption()
+        # (mtime_ns, derived key, result) of the last full decrypt;
+        # UI refreshes between mutations return this instead of
+        # re-running AES over every account.
+        self._list_cache = None
+        # (monotonic ts, bool) so burst UI refreshes don't stat the
+        # store file once per call.
+        self._exists_cache = (0.0, None)
+
+    def _accounts_file_exists(self):
+        now = time.monotonic()
+        ts, value = self._exists_cache
+        if value is None or now - ts >= 1.0:
+            value = self.accounts_file.exists()
+            self._exists_cache = (now, value)
+        return value
+
+    def _load_raw(self):
+        if not self._accounts_file_exists():
+            return {}
+        with open(self.accounts_file, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_raw(self, accounts):
+        with open(self.accounts_file, 'w', encoding='utf-8') as f:
+            json.dump(accounts, f, ensure_ascii=False, indent=2)
+        self._exists_cache = (time.monotonic(), True)
+
+    def verify_master_password(self, password):
+        """True when `password` decrypts the existing store (or it's new)."""
+        self.encryption.set_master_password(password)
+        accounts = self._load_raw()
+        if not accounts:
+            return True
+        probe = next(iter(accounts.values()))
+        try:
+            self.encryption.decrypt(probe['cookie'])
+            return True
+        except (InvalidToken, KeyError):
+            return False
+
+    def add_account(self, account_id, nickname, cookie, note=''):
+        accounts = self._load_raw()
+        accounts[account_id] = {
+            'nickname': nickname,
+            'cookie': self.encryption.encrypt(cookie),
+            'note': note,
+            'status': 'active',
+            'created_at': datetime.now().isoformat(),
+        }
+        self._save_raw(accounts)
+
+    def update_account(self, account_id, **fields):
+        accounts = self._load_raw()
+        if account_id not in accounts:
+            raise KeyError(account_id)
+        if 'cookie' in fields:
+            fields['cookie'] = self.encryption.encrypt(fields['cookie'])
+        accounts[account_id].update(fields)
+        self._save_raw(accounts)
+
+    def delete_account(self, account_id):
+        accounts = self._load_raw()
+        accounts.pop(account_id, None)
+        self._save_raw(accounts)
+
+    def list_accounts(self):
+        """Return decrypted account dicts for display.
+
+        The result is cached against the store file's mtime and the
+        active derived key; file mutations and master-password changes
+        both invalidate it naturally.
+        """
+        mtime = (self.accounts_file.stat().st_mtime_ns
+                 if self._accounts_file_exists() else None)
+        key = self.encryption._derived_key
+        if (self._list_cache is not None
+                and self._list_cache[0] == mtime
+                and self._list_cache[1] == key):
+            return self._list_cache[2]
+        accounts = self._load_raw()
+        result = []
+        for account_id, account in accounts.items():
+            entry = {
+                'id': account_id,
+                'nickname': account.get('nickname', ''),
+                'note': account.get('note', ''),
+                'status': account.get('status', 'unknown'),
+                'created_at': account.get('created_at', ''),
+            }
+            try:
+                entry['cookie'] = self.encryption.decrypt(account['cookie'])
+            except Exception:
+                entry['cookie'] = ''
+                entry['status'] = 'locked'
+            result.append(entry)
+        self._list_cache = (mtime, key, result)
+        return result
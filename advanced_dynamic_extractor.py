@@ -0,0 +1,953 @@
+"""Advanced dynamic website extractor.
+
+Renders JavaScript-heavy pages with Playwright (async API) and extracts
+text, structure, links and image content (OCR) from every page of a
+site, breadth-first from a base URL.
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import re
+import subprocess
+import sys
+import tempfile
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
+from urllib.parse import urljoin, urlparse
+
+# Heavy third-party imports (bs4, playwright, PIL, requests) are
+# deferred to their points of use so importing this module and
+# instantiating the extractor stay cheap for validation paths.
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'content_extractor')
+
+_HEADING_TAGS = frozenset(f'h{level}' for level in range(1, 7))
+_DYNAMIC_CANDIDATES = frozenset(('div', 'span', 'p', 'li'))
+
+# Tracking pixels and analytics beacons are never worth fetching or OCRing.
+_ANALYTICS_RE = re.compile(
+    r'(?:google-analytics|googletagmanager|doubleclick|facebook\.com/tr'
+    r'|/pixel|/beacon|scorecardresearch|quantserve)', re.I)
+
+
+def _is_tiny(img_tag):
+    """True when width/height attributes mark the image as sub-64px."""
+    for attr in ('width', 'height'):
+        value = img_tag.get(attr)
+        if value:
+            try:
+                if int(str(value).rstrip('px')) < 64:
+                    return True
+            except ValueError:
+                pass
+    return False
+
+
+class _CappedSet:
+    """Set that stops accepting members once `cap` is reached.
+
+    The report only ever shows the first 15 classes/ids, so unbounded
+    accumulation (pathological with CSS-in-JS/Tailwind generated class
+    hashes) buys nothing.
+    """
+
+    __slots__ = ('s', 'cap')
+
+    def __init__(self, cap=64):
+        self.s = set()
+        self.cap = cap
+
+    def add(self, value):
+        if len(self.s) < self.cap:
+            self.s.add(value)
+
+
+def _text_of(node, cache):
+    """Memoized stripped text of a node; each subtree is walked once.
+
+    The semantic containers (header/nav/article/section/...) nest, so
+    uncached get_text(strip=True) calls re-walk the same text several
+    times per page. Post-order memoization makes the total cost O(N).
+    """
+    from bs4 import Comment, NavigableString
+
+    key = id(node)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    if isinstance(node, Comment):
+        value = ''
+    elif isinstance(node, NavigableString):
+        value = str(node).strip()
+    else:
+        value = ' '.join(
+            t for t in (_text_of(c, cache) for c in node.contents) if t)
+    cache[key] = value
+    return value
+
+
+def _parse_page(html_content, url):
+    """Parse rendered HTML into a content record.
+
+    Runs in a worker process so the heavy BeautifulSoup work does not
+    block the event loop driving the browser.
+    """
+    from bs4 import BeautifulSoup, NavigableString
+
+    soup = BeautifulSoup(html_content, 'lxml')
+
+    page_content = {
+        'url': url,
+        'title': soup.title.string.strip() if soup.title and soup.title.string else '',
+        'extracted_at': datetime.now().isoformat(),
+        'headings': {},
+        'paragraphs': [],
+        'content_divs': [],
+        'articles': [],
+        'sections': [],
+        'spans': [],
+        'list_items': [],
+        'emphasis': [],
+        'links': [],
+        'images': [],
+        'media': [],
+        'dynamic_elements': [],
+        'page_sections': {},
+        'structure': {},
+    }
+
+    # Single traversal: every find_all is an O(N) tree walk, so the
+    # text buckets, links, images, media, regions and DOM structure are
+    # all collected in one pass dispatching on tag.name.
+    text_cache = {}
+    tag_counts = Counter()
+    classes_used = _CappedSet()
+    ids_used = _CappedSet()
+    region_nodes = {region: [] for region in
+                    ('header', 'nav', 'article', 'section', 'aside', 'footer')}
+
+    for tag in soup.find_all(True):
+        name = tag.name
+        tag_counts[name] += 1
+        for cls in tag.get('class', []):
+            classes_used.add(cls)
+        tag_id = tag.get('id')
+        if tag_id:
+            ids_used.add(tag_id)
+
+        if name in _HEADING_TAGS:
+            text = _text_of(tag, text_cache)
+            if text:
+                page_content['headings'].setdefault(name, []).append(text)
+        elif name == 'p':
+            text = _text_of(tag, text_cache)
+            if text:
+                page_content['paragraphs'].append(text)
+        elif name == 'span':
+            text = _text_of(tag, text_cache)
+            if text and len(text) > 10:
+                page_content['spans'].append(text)
+        elif name == 'li':
+            text = _text_of(tag, text_cache)
+            if text:
+                page_content['list_items'].append(text)
+        elif name in ('strong', 'em'):
+            text = _text_of(tag, text_cache)
+            if text:
+                page_content['emphasis'].append(text)
+        elif name == 'a':
+            href = tag.get('href')
+            if href:
+                page_content['links'].append({
+                    'text': _text_of(tag, text_cache),
+                    'href': urljoin(url, href),
+                })
+        elif name == 'img':
+            # Cheapest checks first: missing src and data: spacers are
+            # rejected before the attribute lookups and the regex run.
+            img_src = tag.get('src')
+            if (img_src and img_src[:5] != 'data:'
+                    and not _is_tiny(tag)
+                    and not _ANALYTICS_RE.search(img_src)):
+                page_content['images'].append({
+                    'src': urljoin(url, img_src),
+                    'alt': tag.get('alt', ''),
+                    'title': tag.get('title', ''),
+                })
+        elif name in ('video', 'iframe', 'source'):
+            src = tag.get('src') or tag.get('data-src')
+            if src:
+                page_content['media'].append({
+                    'tag': name,
+                    'src': urljoin(url, src),
+                })
+
+        if name in region_nodes:
+            region_nodes[name].append(tag)
+
+        # Leaf elements likely produced by JS frameworks (Vue/React
+        # renders): no element children, only text.
+        if name in _DYNAMIC_CANDIDATES and (
+                not tag.contents
+                or all(isinstance(c, NavigableString) for c in tag.contents)):
+            text = _text_of(tag, text_cache)
+            if len(text) > 10:
+                page_content['dynamic_elements'].append(text)
+
+    # Divs that look like main content containers; the [class*=] match
+    # runs inside the selector engine instead of a per-div lambda.
+    for div in soup.select('div[class*="content" i]'):
+        text = _text_of(div, text_cache)
+        if text and len(text) > 20:
+            page_content['content_divs'].append(text)
+
+    # Per-region text and the semantic containers, from the collected nodes
+    for region, nodes in region_nodes.items():
+        texts = [t for t in (_text_of(node, text_cache) for node in nodes) if t]
+        if texts:
+            page_content['page_sections'][region] = texts
+    page_content['articles'] = page_content['page_sections'].get('article', [])
+    page_content['sections'] = page_content['page_sections'].get('section', [])
+    page_content['structure'] = {
+        'tag_counts': dict(tag_counts.most_common(32)),
+        'classes_used': sorted(classes_used.s),
+        'ids_used': sorted(ids_used.s),
+    }
+
+    links = [link['href'] for link in page_content['links']]
+    return page_content, links
+
+
+def _crawl_worker(base_url, options, task_q, result_q):
+    """Worker-process loop: one browser per process, URLs from a queue.
+
+    Renders and parses each URL it pulls and pushes
+    (url, page_content, links) back to the coordinator; frontier
+    management and dedup stay in the coordinator.
+    """
+    extractor = AdvancedDynamicExtractor(base_url, **options)
+
+    async def run():
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            context = await browser.new_context()
+            await extractor._install_resource_blocking(context)
+            sem = asyncio.Semaphore(extractor.concurrency)
+            while True:
+                # Block until the coordinator sends work or the None
+                # shutdown sentinel; an idle timeout here would shed
+                # workers whenever the frontier momentarily empties.
+                url = task_q.get()
+                if url is None:
+                    break
+                try:
+                    html = await extractor._render(url, sem, context)
+                    if html is None:
+                        result_q.put((url, None, []))
+                        continue
+                    page_content, links = _parse_page(html, url)
+                    extractor._process_images(page_content)
+                except Exception as e:
+                    # Report the failure and keep serving; dying with
+                    # the task would strand the coordinator.
+                    print(f"  ✗ Worker failed on {url}: {e}")
+                    result_q.put((url, None, []))
+                    continue
+                result_q.put((url, page_content, links))
+            await context.close()
+            await browser.close()
+
+    asyncio.run(run())
+
+
+class AdvancedDynamicExtractor:
+    """Crawls a site breadth-first and extracts content from every page.
+
+    Pages are rendered concurrently through a bounded pool of Playwright
+    pages inside one headless Chromium process; parsing happens in a
+    process pool so rendering and parsing overlap.
+    """
+
+    @classmethod
+    def check_dependencies(cls):
+        """Try the heavy imports without launching any browser."""
+        try:
+            import bs4  # noqa: F401
+            import playwright.async_api  # noqa: F401
+            import requests  # noqa: F401
+            import PIL  # noqa: F401
+        except ImportError as e:
+            print(f"Missing dependency: {e}")
+            return False
+        return True
+
+    def __init__(self, base_url, max_pages=50, wait_time=10, concurrency=5,
+                 output_dir='extracted_content'):
+        self.base_url = base_url
+        self.domain = urlparse(base_url).netloc
+        self.max_pages = max_pages
+        self.wait_time = wait_time
+        self.concurrency = concurrency
+        self.visited_urls = set()
+        self.to_visit = deque([base_url])
+        self.queued = {base_url}
+        self.failed_urls = []
+        self.pages_extracted = 0
+
+        # Page records are streamed to an append-only jsonl file and
+        # image bytes to individual files as soon as each page is done,
+        # so peak RSS stays O(one page) instead of O(whole crawl).
+        self.output_dir = output_dir
+        self._img_dir = os.path.join(output_dir, 'images')
+        self._pages_path = os.path.join(output_dir, 'pages.jsonl')
+        self._out = None
+
+        # One keep-alive connection pool for all image downloads.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; ContentExtractor/1.0)',
+        })
+        self.img_pool = ThreadPoolExecutor(max_workers=16)
+
+        # Content-addressed caches: logos/sprites repeated across pages
+        # are fetched and OCRed exactly once per crawl. The image cache
+        # maps to the on-disk copy, not raw bytes, so repeats cost a
+        # re-read but RAM stays O(one page) over the whole crawl.
+        self._img_cache = {}   # url -> on-disk path of the bytes
+        self._ocr_cache = {}   # blake2b digest of bytes -> text
+
+        # Conditional-GET state survives across runs: url -> [etag,
+        # last-modified], with validated bytes kept on disk so a 304
+        # answers from the local copy.
+        self._disk_img_dir = os.path.join(_CACHE_DIR, 'images')
+        os.makedirs(self._disk_img_dir, exist_ok=True)
+        self._etag_path = os.path.join(_CACHE_DIR, 'etag_cache.json')
+        try:
+            with open(self._etag_path, encoding='utf-8') as f:
+                self._etag_cache = json.load(f)
+        except (OSError, ValueError):
+            self._etag_cache = {}
+
+        # Browser state is started lazily on first crawl and reused
+        # across runs; close() tears it down.
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._page_pool = deque()  # [page, navigation_count] entries
+
+    _BAD_SUFFIX = re.compile(
+        r'\.(?:pdf|zip|exe|dmg|docx?|xlsx?)(?:\?|#|$)', re.I)
+
+    def is_valid_url(self, url):
+        """Check whether a URL belongs to the crawl frontier."""
+        parsed = urlparse(url)
+        return (parsed.netloc == self.domain
+                and url not in self.visited_urls
+                and not self._BAD_SUFFIX.search(parsed.path))
+
+    def _get_loop(self):
+        """Return the extractor's private event loop, creating it once."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _ensure_browser(self):
+        """Launch Playwright and the browser lazily, once per extractor.
+
+        Repeat crawls (and mere instantiation, e.g. for validation)
+        no longer pay browser startup; the warm browser is reused until
+        close() is called.
+        """
+        if self._context is not None:
+            return self._context
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        # A persistent disk cache lets same-site subresources (JS
+        # bundles, etc.) hit cache on every page after the first.
+        self._browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=[f'--disk-cache-dir={os.path.join(_CACHE_DIR, "chromium")}',
+                  '--disk-cache-size=536870912'])
+        self._context = await self._browser.new_context()
+        await self._install_resource_blocking(self._context)
+        return self._context
+
+    async def _close_browser(self):
+        self._page_pool.clear()
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self):
+        """Shut the browser and the private event loop down."""
+        self._save_etag_cache()
+        loop = self._get_loop()
+        loop.run_until_complete(self._close_browser())
+        loop.close()
+        self._loop = None
+
+    # Resource types the renderer never needs: image bytes are fetched
+    # out-of-band by download_image, and pixels/styles don't affect the
+    # harvested DOM.
+    _BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+
+    async def _install_resource_blocking(self, context):
+        """Abort image/CSS/font/media requests at the network layer."""
+        async def handler(route):
+            if route.request.resource_type in self._BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+        await context.route('**/*', handler)
+
+    # Resolves once no DOM mutation has fired for 500 ms.
+    _DOM_IDLE_JS = """
+        window.__idle = false;
+        window.__t = setTimeout(() => { window.__idle = true; }, 500);
+        new MutationObserver(() => {
+            clearTimeout(window.__t);
+            window.__t = setTimeout(() => { window.__idle = true; }, 500);
+        }).observe(document, {subtree: true, childList: true});
+    """
+
+    async def wait_for_page_load(self, page):
+        """Wait until the DOM is quiet instead of sleeping a fixed time.
+
+        Returns as soon as the document is complete and no mutation has
+        fired for 500 ms, with a hard ceiling of `wait_time` seconds.
+        """
+        deadline = self.wait_time * 1000
+        await page.wait_for_function(
+            "document.readyState === 'complete'", timeout=deadline)
+        await page.evaluate(self._DOM_IDLE_JS)
+        await page.wait_for_function(
+            'window.__idle === true', timeout=deadline)
+
+        # One scroll to the bottom for lazy-load triggering, conditioned
+        # on scrollHeight stability rather than a fixed sleep.
+        last_height = 0
+        for _ in range(5):
+            height = await page.evaluate(
+                'window.scrollTo(0, document.body.scrollHeight);'
+                'document.body.scrollHeight')
+            if height == last_height:
+                break
+            last_height = height
+            await page.wait_for_timeout(300)
+
+    # Retire tabs after this many navigations so JS-heap/DOM growth in
+    # long-lived renderers stays bounded.
+    _PAGE_MAX_USAGE = 50
+
+    async def _acquire_page(self, context):
+        if self._page_pool:
+            return self._page_pool.popleft()
+        return [await context.new_page(), 0]
+
+    async def _release_page(self, entry):
+        entry[1] += 1
+        if entry[1] >= self._PAGE_MAX_USAGE:
+            await entry[0].close()
+        else:
+            self._page_pool.append(entry)
+
+    async def _render(self, url, sem, context):
+        """Render one URL in a pooled warm tab and return the final HTML.
+
+        Reusing tabs keeps the JS context warm, so shared SPA bundles
+        hit the HTTP and V8 code caches instead of re-fetching and
+        re-compiling on every navigation.
+        """
+        async with sem:
+            entry = await self._acquire_page(context)
+            page = entry[0]
+            try:
+                await page.goto(url, wait_until='networkidle',
+                                timeout=self.wait_time * 1000)
+                await self.wait_for_page_load(page)
+                html = await page.content()
+                return html
+            except Exception as e:
+                print(f"  ✗ Failed to render {url}: {e}")
+                return None
+            finally:
+                await self._release_page(entry)
+
+    def download_image(self, img_src, page_url):
+        """Download one image and return its raw bytes (or None)."""
+        cached = self._img_cache.get(img_src)
+        if cached is not None:
+            try:
+                with open(cached, 'rb') as f:
+                    return f.read()
+            except OSError:
+                del self._img_cache[img_src]
+
+        headers = {'Referer': page_url}
+        disk_path = os.path.join(
+            self._disk_img_dir,
+            hashlib.blake2b(img_src.encode(), digest_size=16).hexdigest())
+        validators = self._etag_cache.get(img_src)
+        if validators and os.path.exists(disk_path):
+            etag, last_modified = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        try:
+            # (connect, read) timeouts: dead hosts fail in 2 s instead
+            # of hanging for the full read timeout.
+            response = self.http.get(img_src, timeout=(2, 10),
+                                     headers=headers)
+            if response.status_code == 304:
+                with open(disk_path, 'rb') as f:
+                    data = f.read()
+                self._img_cache[img_src] = disk_path
+                return data
+            if response.status_code == 200:
+                data = response.content
+                # Always spill to disk: the dedupe cache and the 304
+                # path both answer from this copy.
+                with open(disk_path, 'wb') as f:
+                    f.write(data)
+                self._img_cache[img_src] = disk_path
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self._etag_cache[img_src] = [etag, last_modified]
+                return data
+        except Exception as e:
+            print(f"  ✗ Image download failed {img_src}: {e}")
+        return None
+
+    def _save_etag_cache(self):
+        try:
+            with open(self._etag_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etag_cache, f)
+        except OSError:
+            pass
+
+    # Above ~1600px web images add OCR time quadratically with no
+    # accuracy gain; below 40px there is nothing readable.
+    _OCR_MAX_DIM = 1600
+    _OCR_MIN_DIM = 40
+
+    def _prepare_image(self, image_data, path):
+        """Decode, grayscale and bound an image, writing a PNG for OCR.
+
+        Returns False when the image is too small to be worth OCRing.
+        """
+        from PIL import Image
+
+        image = Image.open(BytesIO(image_data))
+        if min(image.size) < self._OCR_MIN_DIM:
+            return False
+        image = image.convert('L')
+        if max(image.size) > self._OCR_MAX_DIM:
+            ratio = self._OCR_MAX_DIM / max(image.size)
+            image = image.resize(
+                (int(image.size[0] * ratio), int(image.size[1] * ratio)),
+                Image.LANCZOS)
+        image.save(path, 'PNG')
+        return True
+
+    def _batch_ocr(self, images_bytes):
+        """OCR a batch of images with a single tesseract invocation.
+
+        One process consumes a text file of image paths, so the model
+        load and process startup are paid once per page instead of once
+        per image. Returns one string per input (empty on failure).
+        """
+        results = ['' for _ in images_bytes]
+        if not images_bytes:
+            return results
+
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_') as tmpdir:
+            paths = []
+            indexes = []
+            for i, data in enumerate(images_bytes):
+                path = os.path.join(tmpdir, f'img_{i:04d}.png')
+                try:
+                    if not self._prepare_image(data, path):
+                        continue
+                except Exception:
+                    continue
+                paths.append(path)
+                indexes.append(i)
+            if not paths:
+                return results
+
+            list_file = os.path.join(tmpdir, 'inputs.txt')
+            with open(list_file, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(paths))
+            out_base = os.path.join(tmpdir, 'out')
+            try:
+                subprocess.run(
+                    ['tesseract', list_file, out_base, '-l', 'eng',
+                     '--psm', '6', '--oem', '1', 'txt'],
+                    check=True, capture_output=True)
+                with open(out_base + '.txt', encoding='utf-8') as f:
+                    combined = f.read()
+            except Exception as e:
+                print(f"  ✗ Batch OCR failed: {e}")
+                return results
+
+            # Tesseract separates per-image results with form feeds.
+            for idx, chunk in zip(indexes, combined.split('\f')):
+                results[idx] = chunk.strip()
+        return results
+
+    def extract_text_from_image(self, image_data):
+        """OCR a single image's bytes into text."""
+        return self._batch_ocr([image_data])[0]
+
+    def _process_images(self, page_content):
+        """Fetch and OCR every image referenced by a parsed page."""
+        futures = [
+            self.img_pool.submit(self.download_image, img['src'],
+                                 page_content['url'])
+            for img in page_content['images']
+        ]
+        to_ocr = []
+        for img, future in zip(page_content['images'], futures):
+            data = future.result()
+            if data is None:
+                continue
+            img['data'] = data
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            img['_digest'] = digest
+            cached = self._ocr_cache.get(digest)
+            if cached is not None:
+                img['ocr_text'] = cached
+            else:
+                to_ocr.append(img)
+
+        ocr_texts = self._batch_ocr([img['data'] for img in to_ocr])
+        for img, text in zip(to_ocr, ocr_texts):
+            img['ocr_text'] = text
+            self._ocr_cache[img.pop('_digest')] = text
+        for img in page_content['images']:
+            img.pop('_digest', None)
+
+    async def _crawl(self):
+        """Drain the frontier in waves of `concurrency` concurrent renders."""
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(self.concurrency)
+
+        context = await self._ensure_browser()
+        with ProcessPoolExecutor() as parse_pool:
+            while self.to_visit and len(self.visited_urls) < self.max_pages:
+                batch = []
+                while self.to_visit and len(batch) < self.concurrency:
+                    current_url = self.to_visit.popleft()
+                    if current_url in self.visited_urls:
+                        continue
+                    if len(self.visited_urls) + len(batch) >= self.max_pages:
+                        break
+                    batch.append(current_url)
+                if not batch:
+                    break
+
+                print(f"Rendering wave of {len(batch)} pages "
+                      f"({len(self.visited_urls)} done)...")
+                htmls = await asyncio.gather(
+                    *[self._render(u, sem, context) for u in batch])
+
+                for url, html in zip(batch, htmls):
+                    self.visited_urls.add(url)
+                    if html is None:
+                        self.failed_urls.append(url)
+                        continue
+
+                    page_content, links = await loop.run_in_executor(
+                        parse_pool, _parse_page, html, url)
+                    self._process_images(page_content)
+                    self._write_page(page_content)
+                    print(f"  ✓ Extracted {url} "
+                          f"({len(page_content['paragraphs'])} paragraphs, "
+                          f"{len(page_content['images'])} images)")
+
+                    for link in links:
+                        if link not in self.queued and self.is_valid_url(link):
+                            self.to_visit.append(link)
+                            self.queued.add(link)
+
+        return self.pages_extracted
+
+    def extract_all_content(self):
+        """Crawl the site and return the per-page content records."""
+        print(f"Starting extraction of {self.base_url} "
+              f"(max {self.max_pages} pages, {self.concurrency} concurrent)")
+        return self._get_loop().run_until_complete(self._crawl())
+
+    def extract_all_content_multiprocess(self, workers=None):
+        """Crawl with one browser per worker process.
+
+        A single headless browser caps concurrency at one renderer
+        process; for whole-site crawls the coordinator feeds a shared
+        task queue consumed by `workers` processes, each owning its own
+        browser, and merges results/links back into the frontier.
+        """
+        workers = workers or os.cpu_count() or 2
+        options = {'max_pages': self.max_pages, 'wait_time': self.wait_time,
+                   'concurrency': self.concurrency}
+        print(f"Starting multiprocess extraction of {self.base_url} "
+              f"({workers} workers, max {self.max_pages} pages)")
+
+        with multiprocessing.Manager() as manager:
+            task_q = manager.Queue()
+            result_q = manager.Queue()
+            procs = [
+                multiprocessing.Process(
+                    target=_crawl_worker,
+                    args=(self.base_url, options, task_q, result_q),
+                    daemon=True)
+                for _ in range(workers)
+            ]
+            for proc in procs:
+                proc.start()
+
+            in_flight = 0
+            pending = set()  # dispatched, no result yet
+            while ((self.to_visit or in_flight)
+                   and len(self.visited_urls) < self.max_pages):
+                while (self.to_visit
+                       and len(self.visited_urls) + in_flight < self.max_pages):
+                    url = self.to_visit.popleft()
+                    if url in self.visited_urls:
+                        continue
+                    task_q.put(url)
+                    pending.add(url)
+                    in_flight += 1
+                if not in_flight:
+                    break
+
+                try:
+                    url, page_content, links = result_q.get(timeout=5)
+                except queue.Empty:
+                    # A worker killed mid-task (e.g. an OOM-killed
+                    # browser) never reports back; prune the dead so
+                    # the crawl degrades instead of waiting forever.
+                    alive = [p for p in procs if p.is_alive()]
+                    dead = len(procs) - len(alive)
+                    procs = alive
+                    if dead:
+                        print(f"  ✗ {dead} worker(s) died; "
+                              f"{len(procs)} remaining")
+                        # Each worker holds at most one task, so give
+                        # up that many units of in-flight work.
+                        in_flight = max(0, in_flight - dead)
+                        if not procs:
+                            # Nobody left to produce results; what was
+                            # dispatched but unfinished is lost.
+                            self.failed_urls.extend(sorted(pending))
+                            break
+                    continue
+                pending.discard(url)
+                in_flight -= 1
+                self.visited_urls.add(url)
+                if page_content is None:
+                    self.failed_urls.append(url)
+                    continue
+                self._write_page(page_content)
+                print(f"  ✓ Extracted {url}")
+                for link in links:
+                    if link not in self.queued and self.is_valid_url(link):
+                        self.to_visit.append(link)
+                        self.queued.add(link)
+
+            for _ in procs:
+                task_q.put(None)
+            for proc in procs:
+                proc.join(timeout=10)
+
+        return self.pages_extracted
+
+    def _open_output(self):
+        if self._out is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            os.makedirs(self._img_dir, exist_ok=True)
+            self._out = open(self._pages_path, 'ab')
+        return self._out
+
+    def _write_page(self, page_content):
+        """Spill one finished page record to disk and drop it from RAM."""
+        try:
+            import orjson
+
+            def dumps(obj):
+                return orjson.dumps(obj)
+        except ImportError:
+            def dumps(obj):
+                return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+        for img in page_content['images']:
+            data = img.pop('data', None)
+            if data is None:
+                continue
+            ext = os.path.splitext(urlparse(img['src']).path)[1] or '.png'
+            digest = hashlib.blake2b(img['src'].encode(),
+                                     digest_size=8).hexdigest()
+            path = os.path.join(self._img_dir, f'img_{digest}{ext}')
+            if not os.path.exists(path):
+                with open(path, 'wb') as f:
+                    f.write(data)
+            img['path'] = path
+
+        out = self._open_output()
+        out.write(dumps(page_content) + b'\n')
+        self.pages_extracted += 1
+
+    def generate_comprehensive_document(self, fp):
+        """Stream a single human-readable report to an open text file.
+
+        Writing directly to the file object keeps peak memory flat
+        instead of accumulating the whole report in one string.
+        """
+        fp.write("=" * 80 + "\n")
+        fp.write("COMPREHENSIVE WEBSITE CONTENT EXTRACTION\n")
+        fp.write(f"Base URL: {self.base_url}\n")
+        fp.write(f"Pages extracted: {self.pages_extracted}\n")
+        fp.write(f"Generated: {datetime.now().isoformat()}\n")
+        fp.write("=" * 80 + "\n\n")
+
+        for page in self.iter_pages():
+            fp.write("-" * 80 + "\n")
+            fp.write(f"PAGE: {page['url']}\n")
+            fp.write(f"TITLE: {page['title']}\n")
+            fp.write("-" * 80 + "\n\n")
+
+            for tag_name, headings in page['headings'].items():
+                fp.write(f"{tag_name.upper()} HEADINGS:\n")
+                for heading in headings:
+                    fp.write(f"  \u2022 {heading}\n")
+                fp.write("\n")
+
+            if page['paragraphs']:
+                fp.write("PARAGRAPHS:\n")
+                for paragraph in page['paragraphs']:
+                    fp.write(f"  {paragraph}\n\n")
+
+            if page['list_items']:
+                fp.write("LIST ITEMS:\n")
+                for item in page['list_items']:
+                    fp.write(f"  \u2022 {item}\n")
+                fp.write("\n")
+
+            if page['dynamic_elements']:
+                fp.write("DYNAMIC CONTENT:\n")
+                for element in page['dynamic_elements']:
+                    fp.write(f"  {element}\n")
+                fp.write("\n")
+
+            if page['images']:
+                fp.write("IMAGES:\n")
+                for img in page['images']:
+                    fp.write(f"  [{img.get('alt') or img['src']}]\n")
+                    ocr_text = img.get('ocr_text', '')
+                    if ocr_text:
+                        fp.write(f"  OCR: {ocr_text}\n")
+                fp.write("\n")
+
+            structure = page['structure']
+            fp.write("PAGE STRUCTURE:\n")
+            top_tags = sorted(structure['tag_counts'].items(),
+                              key=lambda kv: kv[1], reverse=True)[:15]
+            for tag_name, count in top_tags:
+                fp.write(f"  {tag_name}: {count}\n")
+            fp.write(f"  Classes: {', '.join(structure['classes_used'][:15])}\n")
+            fp.write(f"  IDs: {', '.join(structure['ids_used'][:15])}\n")
+            fp.write("\n")
+
+        if self.failed_urls:
+            fp.write("=" * 80 + "\n")
+            fp.write("FAILED URLS:\n")
+            for url in self.failed_urls:
+                fp.write(f"  \u2717 {url}\n")
+
+    def iter_pages(self):
+        """Stream page records back from the jsonl spill file."""
+        try:
+            import orjson
+            loads = orjson.loads
+        except ImportError:
+            loads = json.loads
+        try:
+            f = open(self._pages_path, 'rb')
+        except OSError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+    def iter_images(self):
+        """Yield (src, bytes) for every downloaded image, one at a time."""
+        for page in self.iter_pages():
+            for img in page['images']:
+                path = img.get('path')
+                if path and os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        yield img['src'], f.read()
+
+    def save_results(self):
+        """Write the report; pages/images were already streamed to disk."""
+        if self._out is not None:
+            self._out.flush()
+        os.makedirs(self.output_dir, exist_ok=True)
+        report_path = os.path.join(self.output_dir, 'comprehensive_content.txt')
+        with open(report_path, 'w', encoding='utf-8') as f:
+            self.generate_comprehensive_document(f)
+        print(f"Report saved to {report_path}")
+        print(f"Page records: {self._pages_path}; images: {self._img_dir}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python advanced_dynamic_extractor.py <base_url> "
+              "[max_pages] [workers]")
+        sys.exit(1)
+    base_url = sys.argv[1]
+    max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    extractor = AdvancedDynamicExtractor(base_url, max_pages=max_pages)
+    try:
+        if workers > 1:
+            extractor.extract_all_content_multiprocess(workers=workers)
+        else:
+            extractor.extract_all_content()
+        extractor.save_results()
+    finally:
+        # Flushes the ETag cache (conditional GETs depend on it
+        # surviving the run) and tears down the browser/event loop.
+        extractor.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1219 @@
+"""Tkinter GUI for the content extractors and Xiaohongshu monitoring.
+
+Tabs: extraction, text documents, multimodal documents, XHS keyword
+monitoring (API + browser based) with encrypted account management,
+and an about page.
+"""
+
+import collections
+import concurrent.futures
+import csv
+import itertools
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+import tkinter as tk
+from datetime import datetime
+from functools import cached_property, lru_cache
+from urllib.parse import urlparse
+from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk
+
+XHS_RESULT_COLUMNS = ('keyword', 'title', 'author', 'likes', 'comments', 'time')
+
+# How many document rows are materialized in a Treeview at once; the
+# rest stay in Python lists and are swapped in on scroll.
+TREE_WINDOW = 120
+
+# Below this many posts, scalar datetime formatting beats NumPy's
+# per-call overhead.
+_TS_BATCH_MIN = 32
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts_int):
+    """Format one second-truncated timestamp; bursts share seconds."""
+    return datetime.fromtimestamp(ts_int).strftime('%Y-%m-%d %H:%M')
+
+
+def _format_post_times(posts):
+    """Format each post's timestamp as 'YYYY-MM-DD HH:MM' (or '')."""
+    raw = [post.get('timestamp', 0) or 0 for post in posts]
+    if len(raw) < _TS_BATCH_MIN:
+        out = []
+        for ts in raw:
+            if not ts:
+                out.append('')
+                continue
+            if ts > 1e10:  # milliseconds
+                ts /= 1000
+            out.append(_fmt_ts(int(ts)))
+        return out
+    import numpy as np
+    ts = np.asarray(raw, dtype='float64')
+    ts[ts > 1e10] /= 1000.0
+    # Vectorize only the epoch math; rendering goes through the cached
+    # per-timestamp formatter so posts straddling a DST transition
+    # match the scalar fromtimestamp path exactly. Batches repeat few
+    # distinct timestamps, so each unique one is formatted once.
+    uniq, inverse = np.unique(ts.astype('int64'), return_inverse=True)
+    lut = [_fmt_ts(int(u)) if u else '' for u in uniq]
+    return [lut[i] if t else '' for i, t in zip(inverse, raw)]
+
+
+# Shared fallback for absent nested dicts; rows with no author borrow
+# this instead of allocating a fresh empty dict each.
+_EMPTY = {}
+
+# Monitoring period label -> days; shared by both start paths.
+_PERIOD_MAP = {'24 hours': 1, '3 days': 3, '7 days': 7, '30 days': 30}
+
+_ACCOUNT_STATUS_ICONS = {'active': '✓', 'locked': '🔒', 'unknown': '?'}
+# Pre-rendered 'icon status' labels; known statuses skip per-row
+# f-string formatting during refresh.
+_ACCOUNT_STATUS_LABELS = {
+    status: f'{icon} {status}'
+    for status, icon in _ACCOUNT_STATUS_ICONS.items()
+}
+
+
+def _open_path(path):
+    """Reveal `path` in the system file browser without blocking Tk."""
+    if sys.platform == 'win32':
+        os.startfile(path)
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', path], close_fds=True)
+    else:
+        subprocess.Popen(['xdg-open', path], close_fds=True)
+
+_URL_RE = re.compile(r'^https?://[^\s]+$')
+_INT_RE = re.compile(r'^\d+$')
+_NUM_RE = re.compile(r'^\d+(\.\d+)?$')
+
+_ABOUT_TEXT = """Content Enhanced Extractor
+========================================
+
+Extracts text, images and OCR content from websites,
+including JS-rendered single page applications.
+
+Features:
+  - Plain text site extraction
+  - Multimodal extraction with image OCR
+  - Specialized JS-dynamic extraction
+  - Xiaohongshu keyword monitoring
+  - Encrypted account management
+"""
+
+
+class WebsiteExtractorGUI:
+    """Main application window."""
+
+    def __init__(self, root):
+        self.root = root
+        # clam renders in pure Tk and dodges the slow native widget
+        # paths on macOS (aqua) and Windows (vista).
+        if os.environ.get('CEE_NATIVE_THEME') != '1':
+            style = ttk.Style()
+            try:
+                style.theme_use('clam')
+            except tk.TclError:
+                pass
+        self.root.title('Content Enhanced Extractor')
+        self.root.geometry('1050x740')
+
+        # The extractor module drags in numba/numpy/bs4/PIL; managers
+        # are built on first use so the window paints before all that.
+        self.text_doc_manager = None
+        self.multimodal_doc_manager = None
+        # What each Treeview currently displays, keyed by doc id, so
+        # refreshes only touch rows that actually changed.
+        self._text_tree_state = {}
+        self._multi_tree_state = {}
+        self._text_docs_version = -1
+        self._multi_docs_version = -1
+        self._text_docs_all = []
+        self._multi_docs_all = []
+        self._text_window_start = 0
+        self._multi_window_start = 0
+        # Same windowing for the account tree: the decrypted rows live
+        # here, the Treeview only shows a slice.
+        self._account_tree_state = {}
+        self._accounts_all = []
+        self._account_window_start = 0
+
+        # One reused worker for extraction jobs; submitting to it skips
+        # per-click thread creation and serializes runs naturally.
+        self._bg = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='extract-bg')
+        # Disk writes (image dumps, JSON stores) run here so the
+        # extraction worker isn't stalled on I/O.
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        # Worker threads never touch Tk directly: they push log lines
+        # here and the UI drains the queue in batches on a timer.
+        self.output_queue = queue.Queue()
+        self._progress_q = queue.Queue()
+
+        # Monitoring services pull in Selenium/crypto; they are created
+        # lazily on first use so the GUI paints without those imports.
+        self.monitoring_service = None
+        self.browser_monitor_service = None
+        self.xhs_master_password_verified = False
+        # Derived key kept in-process so force re-verification is an
+        # HMAC compare instead of another 100ms+ KDF run.
+        self._xhs_derived_key = None
+        # Salt file mtime at verification time; a change (external
+        # reset) invalidates the cached verification.
+        self._xhs_salt_mtime = None
+        # Last strings pushed to the status/progress labels; identical
+        # updates are dropped before they reach Tcl.
+        self._last_status_text = None
+        self._last_progress_text = None
+        # Button states applied last; same-status text changes (e.g. a
+        # new keyword count) then skip the button Tcl dispatches.
+        self._last_button_states = None
+        self._last_browser_button_state = None
+        # {note_id: row} currently shown by the browser monitor, so
+        # overlapping result sets only touch changed rows.
+        self._browser_rows_state = {}
+        # Full post dicts backing the results table; the tree shows
+        # truncated titles, exports rebuild rows from these originals.
+        self._xhs_posts = []
+        # status -> widget-state descriptors, built lazily since they
+        # key on the lazily imported MonitoringStatus enum.
+        self._status_table = None
+        self._browser_status_table = None
+        # deque.append/popleft are atomic under the GIL, so producers
+        # skip queue.Queue's per-put lock + notify; the Event just
+        # records that there is something to drain.
+        self.xhs_log_queue = collections.deque()
+        self._xhs_log_wake = threading.Event()
+        self._xhs_ring = collections.deque(maxlen=2000)
+        # Consecutive empty log drains; stretches the poll interval.
+        self._xhs_log_idle_ticks = 0
+        # Last formatted log timestamp; bursts within one second reuse
+        # it instead of re-running strftime per message.
+        self._xhs_log_last_sec = -1
+        self._xhs_log_stamp = ''
+        # Scraped batches land here and are coalesced by a single flush
+        # timer, so fast scrape cycles can't flood the Tk event loop;
+        # the bound also backpressures a runaway worker.
+        self._xhs_results_q = queue.Queue(maxsize=32)
+
+        self.setup_ui()
+
+    # ------------------------------------------------------------------
+    # UI construction
+    # ------------------------------------------------------------------
+
+    def setup_ui(self):
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Tabs are built on first visit; only placeholders exist up
+        # front so mainloop is reached without the XHS/account setup.
+        tabs = (
+            ('Extraction', self.create_extraction_tab),
+            ('Text documents', self.create_text_docs_tab),
+            ('Multimodal documents', self.create_multimodal_docs_tab),
+            ('XHS monitoring', self.create_xiaohongshu_monitor_tab),
+            ('About', self.create_about_tab),
+        )
+        self._tab_frames = []
+        self._tab_builders = {}
+        for index, (title, builder) in enumerate(tabs):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_frames.append(frame)
+            self._tab_builders[index] = builder
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._on_tab_changed()
+
+        self.root.after(50, self._drain_output)
+        self.root.after(100, self.update_xhs_logs)
+        self.root.after(50, self._flush_xhs_results)
+        self.root.after_idle(self._warm_background)
+
+    def _warm_background(self):
+        """Pre-import heavy modules while the user is reading the UI."""
+        if getattr(self, '_warmed', False):
+            return
+        self._warmed = True
+
+        def warm():
+            try:
+                # Pays the OCR kernel's JIT compile cost up front too.
+                from multimodal_web_extractor import warm_preprocess
+                warm_preprocess()
+                import selenium.webdriver  # noqa: F401 chromedriver paths
+                from xiaohongshu_scraper import XiaohongshuScraperConfig
+                XiaohongshuScraperConfig()
+                # Warm the KDF with an in-memory salt: derive_key would
+                # create the real xhs_salt.bin as a side effect and
+                # race first-use salt creation.
+                from account_manager import AccountEncryption
+                from cryptography.hazmat.primitives import hashes
+                from cryptography.hazmat.primitives.kdf.pbkdf2 import (
+                    PBKDF2HMAC)
+                PBKDF2HMAC(algorithm=hashes.SHA256(), length=32,
+                           salt=b'\x00' * 16,
+                           iterations=AccountEncryption.KDF_ITERATIONS
+                           ).derive(b'warmup')
+                from PIL import Image
+                import pytesseract
+                pytesseract.image_to_string(Image.new('L', (1, 1)))
+            except Exception:
+                # Warmup is best effort; real use surfaces real errors.
+                pass
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    def _on_tab_changed(self, event=None):
+        index = self.notebook.index(self.notebook.select())
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self._tab_frames[index])
+
+    def create_extraction_tab(self, frame):
+        form = ttk.LabelFrame(frame, text='Settings')
+        form.pack(fill=tk.X, padx=10, pady=10)
+
+        ttk.Label(form, text='URL:').grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.url_var = tk.StringVar()
+        ttk.Entry(form, textvariable=self.url_var, width=60).grid(
+            row=0, column=1, columnspan=3, sticky=tk.W, padx=5)
+
+        ttk.Label(form, text='Max pages:').grid(row=1, column=0, sticky=tk.W, padx=5)
+        self.max_pages_var = tk.StringVar(value='10')
+        ttk.Entry(form, textvariable=self.max_pages_var, width=8).grid(
+            row=1, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(form, text='Delay (s):').grid(row=1, column=2, sticky=tk.W, padx=5)
+        self.delay_var = tk.StringVar(value='1.0')
+        ttk.Entry(form, textvariable=self.delay_var, width=8).grid(
+            row=1, column=3, sticky=tk.W, padx=5)
+
+        ttk.Label(form, text='Mode:').grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.content_type_var = tk.StringVar(value='text')
+        ttk.Radiobutton(form, text='Text only', variable=self.content_type_var,
+                        value='text').grid(row=2, column=1, sticky=tk.W)
+        ttk.Radiobutton(form, text='Multimodal', variable=self.content_type_var,
+                        value='multimodal').grid(row=2, column=2, sticky=tk.W)
+        ttk.Radiobutton(form, text='JS dynamic', variable=self.content_type_var,
+                        value='js_dynamic').grid(row=2, column=3, sticky=tk.W)
+
+        self.extract_button = ttk.Button(form, text='Start extraction',
+                                         command=self.start_extraction)
+        self.extract_button.grid(row=3, column=1, pady=8)
+
+        self.progress = ttk.Progressbar(frame, mode='determinate', maximum=100)
+        self.progress.pack(fill=tk.X, padx=10)
+        self.root.after(100, self._drain_progress)
+
+        self.output_text = scrolledtext.ScrolledText(frame, height=22)
+        self.output_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    def create_text_docs_tab(self, frame):
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(toolbar, text='Refresh',
+                   command=self.refresh_text_docs).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text='Delete',
+                   command=self.delete_text_doc).pack(side=tk.LEFT, padx=5)
+
+        columns = ('title', 'created', 'url')
+        self.text_docs_tree = ttk.Treeview(frame, columns=columns, show='headings')
+        for col, width in zip(columns, (380, 160, 380)):
+            self.text_docs_tree.heading(col, text=col.title())
+            self.text_docs_tree.column(col, width=width)
+        self.text_docs_scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL,
+                                              command=self._on_text_scroll)
+        self.text_docs_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self.text_docs_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.refresh_text_docs()
+
+    def create_multimodal_docs_tab(self, frame):
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(toolbar, text='Refresh',
+                   command=self.refresh_multimodal_docs).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text='Delete',
+                   command=self.delete_multimodal_doc).pack(side=tk.LEFT, padx=5)
+
+        columns = ('title', 'created', 'images', 'url')
+        self.multimodal_docs_tree = ttk.Treeview(frame, columns=columns,
+                                                 show='headings')
+        for col, width in zip(columns, (360, 160, 70, 330)):
+            self.multimodal_docs_tree.heading(col, text=col.title())
+            self.multimodal_docs_tree.column(col, width=width)
+        self.multimodal_docs_scroll = ttk.Scrollbar(
+            frame, orient=tk.VERTICAL, command=self._on_multi_scroll)
+        self.multimodal_docs_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self.multimodal_docs_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.refresh_multimodal_docs()
+
+    def create_xiaohongshu_monitor_tab(self, frame):
+        settings = ttk.LabelFrame(frame, text='Monitoring')
+        settings.pack(fill=tk.X, padx=10, pady=5)
+
+        ttk.Label(settings, text='Keywords (comma separated):').grid(
+            row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.xhs_keywords_var = tk.StringVar()
+        ttk.Entry(settings, textvariable=self.xhs_keywords_var, width=50).grid(
+            row=0, column=1, columnspan=2, sticky=tk.W, padx=5)
+
+        ttk.Label(settings, text='Period:').grid(row=1, column=0, sticky=tk.W, padx=5)
+        self.xhs_period_var = tk.StringVar(value='7 days')
+        ttk.Combobox(settings, textvariable=self.xhs_period_var, width=12,
+                     values=('24 hours', '3 days', '7 days', '30 days'),
+                     state='readonly').grid(row=1, column=1, sticky=tk.W, padx=5)
+
+        self.xhs_start_button = ttk.Button(
+            settings, text='Start monitoring',
+            command=self.start_xiaohongshu_monitoring)
+        self.xhs_start_button.grid(row=2, column=0, padx=5, pady=8)
+        self.xhs_stop_button = ttk.Button(
+            settings, text='Stop', state=tk.DISABLED,
+            command=self.stop_xiaohongshu_monitoring)
+        self.xhs_stop_button.grid(row=2, column=1, padx=5)
+        self.browser_monitor_button = ttk.Button(
+            settings, text='Start browser monitor',
+            command=self.start_browser_monitoring)
+        self.browser_monitor_button.grid(row=2, column=2, padx=5)
+
+        self.xhs_status_label = tk.Label(settings, text='Monitoring idle',
+                                         fg='gray')
+        self.xhs_status_label.grid(row=3, column=0, columnspan=2,
+                                   sticky=tk.W, padx=5)
+        self.xhs_progress_label = tk.Label(settings, text='')
+        self.xhs_progress_label.grid(row=3, column=2, sticky=tk.W, padx=5)
+
+        # Results table
+        results_frame = ttk.LabelFrame(frame, text='Results')
+        results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.xhs_results_tree = ttk.Treeview(
+            results_frame, columns=XHS_RESULT_COLUMNS, show='headings', height=8)
+        for col, width in zip(XHS_RESULT_COLUMNS, (110, 320, 120, 70, 80, 130)):
+            self.xhs_results_tree.heading(col, text=col.title())
+            self.xhs_results_tree.column(col, width=width)
+        self.xhs_results_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Kept as an attribute: _fill_results_tree re-packs the tree
+        # and needs this as the packing anchor to stay above it.
+        export_bar = self.xhs_export_bar = ttk.Frame(results_frame)
+        export_bar.pack(fill=tk.X, padx=5, pady=3)
+        ttk.Button(export_bar, text='Export Excel',
+                   command=self.export_xhs_results_excel).pack(side=tk.LEFT)
+        ttk.Button(export_bar, text='Export CSV',
+                   command=self.export_xhs_results_csv).pack(side=tk.LEFT, padx=5)
+
+        # Accounts
+        accounts_frame = ttk.LabelFrame(frame, text='Accounts')
+        accounts_frame.pack(fill=tk.X, padx=10, pady=5)
+        self.account_tree = ttk.Treeview(
+            accounts_frame, columns=('id', 'nickname', 'status', 'note'),
+            show='headings', height=4)
+        for col, width in zip(('id', 'nickname', 'status', 'note'),
+                              (140, 160, 120, 300)):
+            self.account_tree.heading(col, text=col.title())
+            self.account_tree.column(col, width=width)
+        self.account_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                               padx=5, pady=5)
+        self.account_scroll = ttk.Scrollbar(accounts_frame, orient=tk.VERTICAL,
+                                            command=self._on_account_scroll)
+        self.account_scroll.pack(side=tk.LEFT, fill=tk.Y, pady=5)
+
+        account_buttons = ttk.Frame(accounts_frame)
+        account_buttons.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        ttk.Button(account_buttons, text='Add',
+                   command=self.add_xhs_account).pack(fill=tk.X, pady=2)
+        ttk.Button(account_buttons, text='Delete',
+                   command=self.delete_xhs_account).pack(fill=tk.X, pady=2)
+        ttk.Button(account_buttons, text='Refresh',
+                   command=self.refresh_xhs_account_list).pack(fill=tk.X, pady=2)
+
+        # Logs
+        log_frame = ttk.LabelFrame(frame, text='Logs')
+        log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        # Plain Text without undo state; content is re-rendered from the
+        # bounded ring each tick so the widget never grows unbounded.
+        self.xhs_log_text = tk.Text(log_frame, height=8, state=tk.DISABLED,
+                                    undo=False, autoseparators=False,
+                                    maxundo=0, wrap='none')
+        log_scroll = ttk.Scrollbar(log_frame, orient=tk.VERTICAL,
+                                   command=self.xhs_log_text.yview)
+        self.xhs_log_text.configure(yscrollcommand=log_scroll.set)
+        log_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self.xhs_log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.xhs_log_text.tag_config('info', foreground='black')
+        self.xhs_log_text.tag_config('success', foreground='green')
+        self.xhs_log_text.tag_config('warning', foreground='orange')
+        self.xhs_log_text.tag_config('error', foreground='red')
+
+    def create_about_tab(self, frame):
+        about_text = tk.Text(frame, wrap=tk.WORD)
+        about_text.insert(tk.END, _ABOUT_TEXT)
+        about_text.configure(state=tk.DISABLED)
+        about_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    # ------------------------------------------------------------------
+    # Extraction
+    # ------------------------------------------------------------------
+
+    def log_output(self, message):
+        """Thread-safe producer side of the extraction log."""
+        self.output_queue.put(message + '\n')
+
+    def _drain_output(self):
+        """Drain queued log lines into the widget in one batched insert."""
+        items = []
+        try:
+            while True:
+                items.append(self.output_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if items:
+            self.output_text.insert(tk.END, ''.join(items))
+            self.output_text.see(tk.END)
+        self.root.after(50, self._drain_output)
+
+    def _drain_progress(self):
+        """Apply only the latest posted progress value, once per tick."""
+        value = None
+        try:
+            while True:
+                value = self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        if value is not None:
+            self.progress['value'] = value
+        self.root.after(100, self._drain_progress)
+
+    def _report_progress(self, done, total):
+        self._progress_q.put(done / max(total, 1) * 100)
+
+    def start_extraction(self):
+        url = self.url_var.get().strip()
+        if (not _URL_RE.match(url)
+                or not _INT_RE.match(self.max_pages_var.get())
+                or not _NUM_RE.match(self.delay_var.get())):
+            messagebox.showerror(
+                'Error', 'Need an http(s) URL, an integer page count '
+                'and a non-negative delay')
+            return
+        max_pages = int(self.max_pages_var.get())
+        delay = float(self.delay_var.get())
+
+        self.extract_button.config(state=tk.DISABLED)
+        self.progress['value'] = 0
+        # Read the mode here too: Tcl variables belong to the main
+        # thread, and the worker must not touch Tk.
+        self._bg.submit(self.perform_extraction, url, max_pages, delay,
+                        self.content_type_var.get())
+
+    def perform_extraction(self, url, max_pages, delay, content_type):
+        self._ensure_doc_managers()
+        try:
+            if content_type == 'text':
+                start = time.time()
+                self.log_output(f'Starting text extraction of {url}')
+                from multimodal_web_extractor import WebsiteTextExtractor
+
+                extractor = WebsiteTextExtractor(
+                    url, max_pages, delay,
+                    progress_callback=self._report_progress)
+                extractor.extract_all_text()
+                first_title = (getattr(extractor, 'first_title', '')
+                               or urlparse(url).netloc)
+                doc_id = f'text_{int(start)}'
+                combined = '\n\n'.join(
+                    entry['content'] for entry in extractor.text_content.values())
+                self.text_doc_manager.add_document(doc_id, url, first_title,
+                                                   combined)
+                self.log_output(
+                    f'✓ Text extraction done: {len(extractor.text_content)} '
+                    f'pages in {time.time() - start:.1f}s')
+
+            elif content_type == 'multimodal':
+                start = time.time()
+                self.log_output(f'Starting multimodal extraction of {url}')
+                from multimodal_web_extractor import MultimodalWebsiteExtractor
+
+                extractor = MultimodalWebsiteExtractor(
+                    url, max_pages, delay,
+                    progress_callback=self._report_progress)
+                extractor.extract_all_content()
+                first_title = (getattr(extractor, 'first_title', '')
+                               or urlparse(url).netloc)
+                doc_id = f'multi_{int(start)}'
+                combined = '\n\n'.join(
+                    entry['content'] for entry in extractor.text_content.values())
+                images_info = []
+                for page_images in extractor.images_info.values():
+                    images_info.extend(page_images)
+                future = self._io_pool.submit(
+                    self.multimodal_doc_manager.add_document,
+                    doc_id, url, first_title, combined, images_info)
+                future.add_done_callback(self._schedule_save_done)
+                self.log_output(
+                    f'✓ Multimodal extraction done: {len(images_info)} images '
+                    f'in {time.time() - start:.1f}s')
+
+            else:
+                start = time.time()
+                self.log_output(f'Starting JS-dynamic extraction of {url}')
+                from specialized_js_extractor import SpecializedJSDynamicExtractor
+
+                extractor = SpecializedJSDynamicExtractor()
+                extractor.extract_all_content([url])
+                first_title = (getattr(extractor, 'first_title', '')
+                               or urlparse(url).netloc)
+                doc_id = f'js_{int(start)}'
+                self.text_doc_manager.add_document(
+                    doc_id, url, first_title, extractor.generate_detailed_report())
+                self.log_output(
+                    f'✓ JS extraction done in {time.time() - start:.1f}s')
+        except Exception as e:
+            self.log_output(f'✗ Extraction failed: {e}')
+        finally:
+            self.root.after(0, self.extraction_complete)
+
+    def _schedule_save_done(self, future):
+        self.root.after(0, self._on_save_done, future)
+
+    def _on_save_done(self, future):
+        error = future.exception()
+        if error is not None:
+            self.log_output(f'✗ Saving multimodal document failed: {error}')
+        else:
+            self.refresh_multimodal_docs()
+
+    def extraction_complete(self):
+        self._progress_q.put(100.0)
+        self.extract_button.config(state=tk.NORMAL)
+        self.refresh_text_docs()
+        self.refresh_multimodal_docs()
+
+    # ------------------------------------------------------------------
+    # Document lists
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _render_window(tree, scrollbar, state, rows, start):
+        """Materialize only `rows[start:start+TREE_WINDOW]` into `tree`.
+
+        `rows` is the full [(doc_id, values)] list; `state` is what the
+        tree currently shows ({doc_id: values}, insertion-ordered).
+        When the visible ids are unchanged only modified rows are
+        touched, otherwise the window is rebuilt. Returns the clamped
+        start offset and the new state.
+        """
+        n = len(rows)
+        start = max(0, min(start, max(0, n - TREE_WINDOW)))
+        window = rows[start:start + TREE_WINDOW]
+        window_ids = [doc_id for doc_id, _ in window]
+        if window_ids == list(state):
+            for doc_id, values in window:
+                if state[doc_id] != values:
+                    tree.item(doc_id, values=values)
+        else:
+            # Keyed diff: drop rows that left the window, mutate or
+            # move survivors (keeping selection), insert only newcomers.
+            stale = state.keys() - set(window_ids)
+            if stale:
+                tree.delete(*stale)
+            for pos, (doc_id, values) in enumerate(window):
+                if doc_id in state:
+                    if state[doc_id] != values:
+                        tree.item(doc_id, values=values)
+                    tree.move(doc_id, '', pos)
+                else:
+                    tree.insert('', pos, iid=doc_id, values=values)
+        if n > TREE_WINDOW:
+            scrollbar.set(start / n, (start + TREE_WINDOW) / n)
+        else:
+            scrollbar.set(0.0, 1.0)
+        return start, dict(window)
+
+    def _scroll_offset(self, start, total, action, amount, units=None):
+        if action == 'moveto':
+            return int(float(amount) * total)
+        step = TREE_WINDOW // 2 if units == 'pages' else 3
+        return start + int(amount) * step
+
+    def _on_text_scroll(self, action, amount, units=None):
+        self._text_window_start = self._scroll_offset(
+            self._text_window_start, len(self._text_docs_all),
+            action, amount, units)
+        self._text_window_start, self._text_tree_state = self._render_window(
+            self.text_docs_tree, self.text_docs_scroll,
+            self._text_tree_state, self._text_docs_all,
+            self._text_window_start)
+
+    def _on_account_scroll(self, action, amount, units=None):
+        self._account_window_start = self._scroll_offset(
+            self._account_window_start, len(self._accounts_all),
+            action, amount, units)
+        (self._account_window_start,
+         self._account_tree_state) = self._render_window(
+            self.account_tree, self.account_scroll,
+            self._account_tree_state, self._accounts_all,
+            self._account_window_start)
+
+    def _on_multi_scroll(self, action, amount, units=None):
+        self._multi_window_start = self._scroll_offset(
+            self._multi_window_start, len(self._multi_docs_all),
+            action, amount, units)
+        self._multi_window_start, self._multi_tree_state = self._render_window(
+            self.multimodal_docs_tree, self.multimodal_docs_scroll,
+            self._multi_tree_state, self._multi_docs_all,
+            self._multi_window_start)
+
+    def _ensure_doc_managers(self):
+        if self.text_doc_manager is None:
+            from multimodal_web_extractor import (DocumentManager,
+                                                  MultimodalDocumentManager)
+            self.text_doc_manager = DocumentManager()
+            self.multimodal_doc_manager = MultimodalDocumentManager()
+
+    def refresh_text_docs(self):
+        if not hasattr(self, 'text_docs_tree'):
+            return
+        self._ensure_doc_managers()
+        version = self.text_doc_manager.version
+        if version == self._text_docs_version:
+            return
+        self._text_docs_version = version
+        self._text_docs_all = [
+            (doc['id'], (doc['title'], doc['created_at'], doc['url']))
+            for doc in self.text_doc_manager.list_documents()
+        ]
+        self._text_window_start, self._text_tree_state = self._render_window(
+            self.text_docs_tree, self.text_docs_scroll,
+            self._text_tree_state, self._text_docs_all,
+            self._text_window_start)
+
+    def refresh_multimodal_docs(self):
+        if not hasattr(self, 'multimodal_docs_tree'):
+            return
+        self._ensure_doc_managers()
+        version = self.multimodal_doc_manager.version
+        if version == self._multi_docs_version:
+            return
+        self._multi_docs_version = version
+        self._multi_docs_all = [
+            (doc['id'], (doc['title'], doc['created_at'],
+                         doc['image_count'], doc['url']))
+            for doc in self.multimodal_doc_manager.list_documents()
+        ]
+        self._multi_window_start, self._multi_tree_state = self._render_window(
+            self.multimodal_docs_tree, self.multimodal_docs_scroll,
+            self._multi_tree_state, self._multi_docs_all,
+            self._multi_window_start)
+
+    def delete_text_doc(self):
+        selection = self.text_docs_tree.selection()
+        if not selection:
+            return
+        for doc_id in selection:
+            self.text_doc_manager.delete_document(doc_id)
+        self.refresh_text_docs()
+
+    def delete_multimodal_doc(self):
+        selection = self.multimodal_docs_tree.selection()
+        if not selection:
+            return
+        for doc_id in selection:
+            self.multimodal_doc_manager.delete_document(doc_id)
+        self.refresh_multimodal_docs()
+
+    # ------------------------------------------------------------------
+    # XHS monitoring
+    # ------------------------------------------------------------------
+
+    def log_xhs(self, message, level='info'):
+        sec = int(time.time())
+        if sec != self._xhs_log_last_sec:
+            self._xhs_log_stamp = time.strftime('%H:%M:%S',
+                                                time.localtime(sec))
+            self._xhs_log_last_sec = sec
+        self.xhs_log_queue.append(
+            (f'[{self._xhs_log_stamp}] {message}\n', level))
+        self._xhs_log_wake.set()
+
+    def update_xhs_logs(self):
+        if not hasattr(self, 'xhs_log_text'):
+            # XHS tab not built yet; keep the queue for later.
+            self.root.after(100, self.update_xhs_logs)
+            return
+        self._xhs_log_wake.clear()
+        changed = False
+        if self.xhs_log_queue:
+            try:
+                while True:
+                    self._xhs_ring.append(self.xhs_log_queue.popleft())
+                    changed = True
+            except IndexError:
+                pass
+        if changed:
+            # Re-render the whole (bounded) ring in one insert, then
+            # apply tag ranges per run of same-tag lines.
+            self.xhs_log_text.configure(state=tk.NORMAL)
+            self.xhs_log_text.delete('1.0', tk.END)
+            self.xhs_log_text.insert(
+                '1.0', ''.join(message for message, _ in self._xhs_ring))
+            line = 1
+            for tag, run in itertools.groupby(self._xhs_ring,
+                                              key=lambda t: t[1]):
+                count = sum(1 for _ in run)
+                self.xhs_log_text.tag_add(tag, f'{line}.0',
+                                          f'{line + count}.0')
+                line += count
+            self.xhs_log_text.see(tk.END)
+            self.xhs_log_text.configure(state=tk.DISABLED)
+        # Adaptive poll: stay at 100ms while traffic flows, back off
+        # toward 1s across idle ticks so a quiet GUI stops waking Tk
+        # ten times a second.
+        if changed:
+            self._xhs_log_idle_ticks = 0
+        else:
+            self._xhs_log_idle_ticks += 1
+        self.root.after(min(1000, 100 * (1 + self._xhs_log_idle_ticks)),
+                        self.update_xhs_logs)
+
+    def _ensure_monitoring_service(self):
+        if self.monitoring_service is None:
+            from xiaohongshu_monitoring_service import XiaohongshuMonitoringService
+            self.monitoring_service = XiaohongshuMonitoringService()
+            self.setup_monitoring_callbacks()
+        return self.monitoring_service
+
+    def _ensure_browser_monitor_service(self):
+        if self.browser_monitor_service is None:
+            from xiaohongshu_monitoring_service import (
+                XiaohongshuBrowserMonitorService,
+            )
+            self.browser_monitor_service = XiaohongshuBrowserMonitorService()
+            self.setup_browser_monitor_callbacks()
+        return self.browser_monitor_service
+
+    def _on_monitoring_results(self, posts):
+        self._xhs_results_q.put(posts)
+
+    def _flush_xhs_results(self):
+        """Drain queued result batches into one table update per tick."""
+        if hasattr(self, 'xhs_results_tree'):
+            batch = []
+            try:
+                while len(batch) < 200:
+                    batch.extend(self._xhs_results_q.get_nowait())
+            except queue.Empty:
+                pass
+            if batch:
+                self.update_xhs_results_table(batch)
+        self.root.after(50, self._flush_xhs_results)
+
+    def _on_browser_monitor_results(self, posts):
+        self.root.after(0, self.update_browser_monitor_results_table, posts)
+
+    def setup_monitoring_callbacks(self):
+        self.monitoring_service.on_status_change = self.on_monitoring_status_change
+        self.monitoring_service.on_progress = self.on_monitoring_progress
+        self.monitoring_service.on_results = self._on_monitoring_results
+        self.monitoring_service.on_log = self.log_xhs
+
+    def setup_browser_monitor_callbacks(self):
+        self.browser_monitor_service.on_status_change = (
+            self.on_browser_monitor_status_change)
+        self.browser_monitor_service.on_progress = self.on_monitoring_progress
+        self.browser_monitor_service.on_results = (
+            self._on_browser_monitor_results)
+        self.browser_monitor_service.on_log = self.log_xhs
+
+    @cached_property
+    def xhs_account_manager(self):
+        """Built on first access; crypto imports stay off startup."""
+        from account_manager import AccountManager
+        return AccountManager()
+
+    def verify_xhs_master_password_once(self, force=False):
+        encryption = self.xhs_account_manager.encryption
+        try:
+            salt_mtime = encryption.salt_path.stat().st_mtime_ns
+        except OSError:
+            salt_mtime = None
+        if (self.xhs_master_password_verified
+                and salt_mtime != self._xhs_salt_mtime):
+            # Salt replaced under us; the cached key no longer matches.
+            self.xhs_master_password_verified = False
+            self._xhs_derived_key = None
+        if self.xhs_master_password_verified and not force:
+            return True
+        if force and encryption.verify_fast(self._xhs_derived_key):
+            return True
+        password = simpledialog.askstring('Master password',
+                                          'Enter the master password:',
+                                          show='*')
+        if not password:
+            return False
+        if not self.xhs_account_manager.verify_master_password(password):
+            messagebox.showerror('Error', 'Wrong master password')
+            return False
+        # Keep only the derived key; the plaintext goes out of scope.
+        self._xhs_derived_key = encryption._derived_key
+        self.xhs_master_password_verified = True
+        # Re-stat: verification may have just created the salt file.
+        try:
+            self._xhs_salt_mtime = encryption.salt_path.stat().st_mtime_ns
+        except OSError:
+            self._xhs_salt_mtime = None
+        self.refresh_xhs_account_list()
+        return True
+
+    def stop_xiaohongshu_monitoring(self):
+        if self.monitoring_service is None:
+            return
+        self.monitoring_service.stop()
+        self.log_xhs('Stop requested', 'warning')
+
+    def start_browser_monitoring(self):
+        if not self.verify_xhs_master_password_once():
+            return
+        raw = self.xhs_keywords_var.get()
+        keywords = [k for part in raw.split(',') if (k := part.strip())]
+        if not keywords:
+            messagebox.showerror('Error', 'Enter at least one keyword')
+            return
+        period_days = _PERIOD_MAP.get(self.xhs_period_var.get(), 7)
+        self._ensure_browser_monitor_service().start(keywords, period_days)
+        self.log_xhs(f'Started browser monitoring {len(keywords)} keyword(s)')
+
+    def start_xiaohongshu_monitoring(self):
+        if not self.verify_xhs_master_password_once():
+            return
+        raw = self.xhs_keywords_var.get()
+        keywords = [k for part in raw.split(',') if (k := part.strip())]
+        if not keywords:
+            messagebox.showerror('Error', 'Enter at least one keyword')
+            return
+        period_days = _PERIOD_MAP.get(self.xhs_period_var.get(), 7)
+        self._ensure_monitoring_service().start(keywords, period_days)
+        self.log_xhs(f'Started monitoring {len(keywords)} keyword(s)')
+
+    def _get_status_tables(self):
+        if self._status_table is None:
+            from xiaohongshu_monitoring_service import MonitoringStatus
+            # (label color, start-button state, stop-button state)
+            self._status_table = {
+                MonitoringStatus.IDLE: ('gray', tk.NORMAL, tk.DISABLED),
+                MonitoringStatus.RUNNING: ('green', tk.DISABLED, tk.NORMAL),
+                MonitoringStatus.STOPPING: ('orange', tk.DISABLED,
+                                            tk.DISABLED),
+                MonitoringStatus.STOPPED: ('gray', tk.NORMAL, tk.DISABLED),
+                MonitoringStatus.ERROR: ('red', tk.NORMAL, tk.DISABLED),
+            }
+            # (label color, browser-button state)
+            self._browser_status_table = {
+                MonitoringStatus.IDLE: ('gray', tk.NORMAL),
+                MonitoringStatus.RUNNING: ('green', tk.DISABLED),
+                MonitoringStatus.STOPPING: ('orange', tk.DISABLED),
+                MonitoringStatus.STOPPED: ('gray', tk.NORMAL),
+                MonitoringStatus.ERROR: ('red', tk.NORMAL),
+            }
+        return self._status_table, self._browser_status_table
+
+    # The label-text dedupe only guards the (shared) label config; the
+    # API and browser monitors format identical texts for the same
+    # status, so button states get their own change checks — gating
+    # them on the text would let one service's update swallow the
+    # other's button transition.
+
+    def _apply_status(self, text, color, start_state, stop_state):
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.xhs_status_label.config(text=text, fg=color)
+        states = (start_state, stop_state)
+        if states != self._last_button_states:
+            self._last_button_states = states
+            self.xhs_start_button.config(state=start_state)
+            self.xhs_stop_button.config(state=stop_state)
+
+    def _apply_browser_status(self, text, color, button_state):
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.xhs_status_label.config(text=text, fg=color)
+        if button_state != self._last_browser_button_state:
+            self._last_browser_button_state = button_state
+            self.browser_monitor_button.config(state=button_state)
+
+    def on_monitoring_status_change(self, status, keyword_count=0):
+        from xiaohongshu_monitoring_service import format_status_message
+        desc = self._get_status_tables()[0].get(status)
+        if desc is None:
+            return
+        text = format_status_message(status, keyword_count)
+        self.root.after(0, self._apply_status, text, *desc)
+
+    def on_browser_monitor_status_change(self, status, keyword_count=0):
+        from xiaohongshu_monitoring_service import format_status_message
+        desc = self._get_status_tables()[1].get(status)
+        if desc is None:
+            return
+        text = format_status_message(status, keyword_count)
+        self.root.after(0, self._apply_browser_status, text, *desc)
+
+    def _set_progress_text(self, text):
+        self.xhs_progress_label.config(text=text)
+
+    def on_monitoring_progress(self, current, total):
+        from xiaohongshu_monitoring_service import format_progress_message
+        text = format_progress_message(current, total)
+        if text == self._last_progress_text:
+            return
+        self._last_progress_text = text
+        self.root.after(0, self._set_progress_text, text)
+
+    def _build_result_rows(self, posts, truncate=True):
+        """Precompute the value tuples for the results table.
+
+        `truncate=False` keeps full titles; exports use it so saved
+        files never inherit the display truncation.
+        """
+        rows = []
+        append = rows.append
+        time_strs = _format_post_times(posts)
+        for post, time_str in zip(posts, time_strs):
+            title = post.get('title', '')
+            if truncate and len(title) > 50:
+                title = title[:50] + '...'
+            author = post.get('author') or _EMPTY
+            append((
+                post.get('keyword', ''),
+                title,
+                author.get('nickname', ''),
+                post.get('likes', 0),
+                post.get('comments', 0),
+                time_str,
+            ))
+        return rows
+
+    def _fill_results_tree(self, rows):
+        """Swap the table contents in while the tree is unmapped.
+
+        Detaching the widget suppresses the per-insert redraws; Tk does
+        one relayout when it is packed back.
+        """
+        tree = self.xhs_results_tree
+        self._browser_rows_state = {}
+        tree.pack_forget()
+        try:
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            for row in rows:
+                insert('', tk.END, values=row)
+        finally:
+            # `before` restores the original packing order; a plain
+            # pack would append the tree after the export bar.
+            tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5,
+                      before=self.xhs_export_bar)
+
+    def update_xhs_results_table(self, posts):
+        self._xhs_posts = list(posts)
+        self._fill_results_tree(self._build_result_rows(posts))
+        self.log_xhs(f'Results table updated: {len(posts)} posts', 'success')
+
+    def update_browser_monitor_results_table(self, posts):
+        # Browser-monitor cycles mostly re-deliver the same posts;
+        # diff against what's shown instead of clearing the tree.
+        tree = self.xhs_results_tree
+        fresh = {}
+        fresh_posts = {}
+        for post, row in zip(posts, self._build_result_rows(posts)):
+            key = str(post.get('note_id') or post.get('url', ''))
+            fresh[key] = row
+            fresh_posts[key] = post
+        # Diff against the widget's real contents, not just the state
+        # dict: a full API fill leaves auto-iid rows in the tree that
+        # the state doesn't know about, and those must go too.
+        existing = set(tree.get_children())
+        for iid in existing - fresh.keys():
+            tree.delete(iid)
+        state = self._browser_rows_state
+        insert = tree.insert
+        for note_id, row in fresh.items():
+            if note_id in existing:
+                if state.get(note_id) != row:
+                    tree.item(note_id, values=row)
+            else:
+                insert('', tk.END, iid=note_id, values=row)
+        self._browser_rows_state = fresh
+        self._xhs_posts = list(fresh_posts.values())
+
+    # ------------------------------------------------------------------
+    # Exports
+    # ------------------------------------------------------------------
+
+    def export_xhs_results_excel(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension='.xlsx',
+            filetypes=[('Excel files', '*.xlsx')])
+        if not path:
+            return
+        items = self._build_result_rows(self._xhs_posts, truncate=False)
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            # openpyxl absent: fall back to pandas building the sheet.
+            import pandas as pd
+            pd.DataFrame(items, columns=XHS_RESULT_COLUMNS).to_excel(
+                path, index=False)
+        else:
+            # Write-only workbooks stream rows to disk instead of
+            # materializing every cell in memory.
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(list(XHS_RESULT_COLUMNS))
+            for row in items:
+                ws.append(list(row))
+            wb.save(path)
+        self.log_xhs(f'Exported {len(items)} rows to {path}', 'success')
+        _open_path(os.path.dirname(path))
+
+    def export_xhs_results_csv(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension='.csv',
+            filetypes=[('CSV files', '*.csv')])
+        if not path:
+            return
+        items = self._build_result_rows(self._xhs_posts, truncate=False)
+        with open(path, 'w', newline='', encoding='utf-8-sig',
+                  buffering=1024 * 1024) as f:
+            writer = csv.writer(f)
+            writer.writerow(XHS_RESULT_COLUMNS)
+            writer.writerows(items)
+        self.log_xhs(f'Exported {len(items)} rows to {path}', 'success')
+        _open_path(os.path.dirname(path))
+
+    # ------------------------------------------------------------------
+    # Accounts
+    # ------------------------------------------------------------------
+
+    def refresh_xhs_account_list(self):
+        if not self.xhs_master_password_verified:
+            return
+        # Decrypting a large store takes visible time; run it on the
+        # I/O pool (OpenSSL releases the GIL inside AES) and render
+        # when the result lands. Cached hits come back effectively at
+        # once. Not the extraction worker: a multi-minute crawl on that
+        # single-slot executor would stall the list until it finished.
+        future = self._io_pool.submit(self.xhs_account_manager.list_accounts)
+        future.add_done_callback(self._schedule_account_render)
+
+    def _schedule_account_render(self, future):
+        self.root.after(0, self._render_account_list, future)
+
+    def _render_account_list(self, future):
+        try:
+            accounts = future.result()
+        except Exception as e:
+            self.log_xhs(f'Listing accounts failed: {e}', 'error')
+            return
+        label = _ACCOUNT_STATUS_LABELS.get
+        self._accounts_all = [
+            (account['id'],
+             (account['id'], account['nickname'],
+              label(account['status']) or f"? {account['status']}",
+              account['note']))
+            for account in accounts
+        ]
+        (self._account_window_start,
+         self._account_tree_state) = self._render_window(
+            self.account_tree, self.account_scroll,
+            self._account_tree_state, self._accounts_all,
+            self._account_window_start)
+
+    @staticmethod
+    def _read_form(fields):
+        """Read and strip every entry of a dialog form in one pass."""
+        return {name: entry.get().strip() for name, entry in fields.items()}
+
+    def add_xhs_account(self):
+        if not self.verify_xhs_master_password_once():
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title('Add account')
+        dialog.grab_set()
+
+        ttk.Label(dialog, text='Account id:').grid(row=0, column=0, padx=5, pady=5)
+        id_entry = ttk.Entry(dialog, width=30)
+        id_entry.grid(row=0, column=1, padx=5)
+        ttk.Label(dialog, text='Nickname:').grid(row=1, column=0, padx=5, pady=5)
+        nickname_entry = ttk.Entry(dialog, width=30)
+        nickname_entry.grid(row=1, column=1, padx=5)
+        ttk.Label(dialog, text='Cookie:').grid(row=2, column=0, padx=5, pady=5)
+        cookie_entry = ttk.Entry(dialog, width=30)
+        cookie_entry.grid(row=2, column=1, padx=5)
+        ttk.Label(dialog, text='Note:').grid(row=3, column=0, padx=5, pady=5)
+        note_entry = ttk.Entry(dialog, width=30)
+        note_entry.grid(row=3, column=1, padx=5)
+
+        fields = {'id': id_entry, 'nickname': nickname_entry,
+                  'cookie': cookie_entry, 'note': note_entry}
+
+        def on_save():
+            values = self._read_form(fields)
+            if not values['id'] or not values['cookie']:
+                messagebox.showerror('Error', 'Id and cookie are required',
+                                     parent=dialog)
+                return
+            self.xhs_account_manager.add_account(
+                values['id'], values['nickname'],
+                values['cookie'], values['note'])
+            dialog.destroy()
+            self.refresh_xhs_account_list()
+            self.log_xhs(f"Account {values['id']} added", 'success')
+
+        ttk.Button(dialog, text='Save', command=on_save).grid(
+            row=4, column=1, pady=8)
+
+    def delete_xhs_account(self):
+        selection = self.account_tree.selection()
+        if not selection:
+            return
+        for item in selection:
+            account_id = self.account_tree.item(item)['values'][0]
+            self.xhs_account_manager.delete_account(str(account_id))
+        self.refresh_xhs_account_list()
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+
+    def on_closing(self):
+        if self.monitoring_service is not None or self.browser_monitor_service is not None:
+            from xiaohongshu_monitoring_service import MonitoringStatus
+            if (self.monitoring_service is not None
+                    and self.monitoring_service.status == MonitoringStatus.RUNNING):
+                self.monitoring_service.stop()
+            if (self.browser_monitor_service is not None
+                    and self.browser_monitor_service.status == MonitoringStatus.RUNNING):
+                self.browser_monitor_service.stop()
+        self._bg.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=True)
+        self.root.destroy()
+
+
+def main():
+    root = tk.Tk()
+    app = WebsiteExtractorGUI(root)
+    root.protocol('WM_DELETE_WINDOW', app.on_closing)
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+"""Text and multimodal (text + image/OCR) website extractors.
+
+Also holds the document managers used by the GUI to persist extraction
+results as JSON stores on disk.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import sys
+import tempfile
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+import numba
+import numpy as np
+import requests
+from bs4 import BeautifulSoup
+from PIL import Image
+import pytesseract
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_USER_AGENT = 'Mozilla/5.0 (compatible; ContentExtractor/1.0)'
+
+
+def _install_uring_policy():
+    """Use the io_uring event loop on Linux when available."""
+    if sys.platform != 'linux':
+        return
+    try:
+        import uringcore
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def _preprocess(img_array):
+    """Grayscale + threshold an RGB uint8 array before OCR."""
+    height, width = img_array.shape[0], img_array.shape[1]
+    out = np.empty((height, width), dtype=np.uint8)
+    for y in numba.prange(height):
+        for x in range(width):
+            luma = (0.299 * img_array[y, x, 0]
+                    + 0.587 * img_array[y, x, 1]
+                    + 0.114 * img_array[y, x, 2])
+            out[y, x] = 255 if luma > 127.0 else 0
+    return out
+
+
+def warm_preprocess():
+    """Trigger the JIT compile before the first real image arrives."""
+    _preprocess(np.zeros((1, 1, 3), dtype=np.uint8))
+
+
+class WebsiteTextExtractor:
+    """Extracts plain text content from every page of a site."""
+
+    def __init__(self, base_url, max_pages=10, delay=1.0, concurrency=8,
+                 progress_callback=None):
+        self.base_url = base_url
+        self.domain = urlparse(base_url).netloc
+        self.max_pages = max_pages
+        self.delay = delay
+        self.concurrency = concurrency
+        self.progress_callback = progress_callback
+        self.text_content = {}
+        self.visited_urls = set()
+        self.first_title = ''
+        self._host_locks = {}
+
+    def parse_page(self, url, html):
+        """Parse one fetched page into (entry, same-domain links).
+
+        The soup is built once here; subclasses harvest extra content
+        from it through `_parse_extra` instead of re-parsing the html.
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        title = soup.title.string.strip() if soup.title and soup.title.string else url
+        entry = {'title': title}
+        # Runs before script/style removal mutates the soup.
+        self._parse_extra(soup, url, entry)
+        for tag in soup(['script', 'style', 'noscript']):
+            tag.decompose()
+        entry['content'] = soup.get_text(separator='\n', strip=True)
+        links = []
+        for a in soup.find_all('a', href=True):
+            href = urljoin(url, a['href'])
+            if urlparse(href).netloc == self.domain:
+                links.append(href)
+        return entry, links
+
+    def _parse_extra(self, soup, url, entry):
+        """Hook for subclasses to pull more out of the shared soup."""
+
+    async def _fetch_one(self, session, sem, url):
+        """Fetch one URL, honouring the per-host politeness delay."""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with sem:
+            async with lock:
+                await asyncio.sleep(self.delay)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.text()
+
+    async def _crawl(self):
+        """Breadth-first crawl fetching each wave of links concurrently."""
+        sem = asyncio.Semaphore(self.concurrency)
+        frontier = [self.base_url]
+        connector = aiohttp.TCPConnector(limit=32)
+        async with aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': _USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=15)) as session:
+            while frontier and len(self.visited_urls) < self.max_pages:
+                wave = []
+                for url in frontier:
+                    if url in self.visited_urls:
+                        continue
+                    self.visited_urls.add(url)
+                    wave.append(url)
+                    if len(self.visited_urls) >= self.max_pages:
+                        break
+                results = await asyncio.gather(
+                    *[self._fetch_one(session, sem, url) for url in wave],
+                    return_exceptions=True)
+                next_frontier = []
+                for url, html in zip(wave, results):
+                    if isinstance(html, Exception):
+                        print(f"  ✗ Failed to fetch {url}: {html}")
+                        continue
+                    try:
+                        entry, links = self.parse_page(url, html)
+                    except Exception as e:
+                        print(f"  ✗ Failed to parse {url}: {e}")
+                        continue
+                    entry['extracted_at'] = datetime.now().isoformat()
+                    if not self.first_title:
+                        self.first_title = entry['title']
+                    self.text_content[url] = entry
+                    if self.progress_callback:
+                        self.progress_callback(len(self.text_content),
+                                               self.max_pages)
+                    for link in links:
+                        if link not in self.visited_urls:
+                            next_frontier.append(link)
+                frontier = next_frontier
+
+    def extract_all_text(self):
+        _install_uring_policy()
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._crawl())
+        finally:
+            loop.close()
+        return self.text_content
+
+
+class MultimodalWebsiteExtractor(WebsiteTextExtractor):
+    """Extracts text plus images, running OCR over each image."""
+
+    def __init__(self, base_url, max_pages=10, delay=1.0, concurrency=8,
+                 progress_callback=None):
+        super().__init__(base_url, max_pages, delay, concurrency,
+                         progress_callback)
+        self.images_info = {}
+
+    def _parse_extra(self, soup, url, entry):
+        # Only record image descriptors here; downloads and OCR happen
+        # after the crawl so they don't block the event loop.
+        images = []
+        for img in soup.find_all('img'):
+            src = img.get('src', '')
+            if not src or src.startswith('data:'):
+                continue
+            images.append({'src': urljoin(url, src),
+                           'alt': img.get('alt', '')})
+        entry['images'] = images
+
+    def _fetch_images(self, entry):
+        """Download and OCR the images recorded for one page."""
+        images = []
+        for img in entry.get('images', []):
+            img_url = img['src']
+            try:
+                img_resp = requests.get(img_url, timeout=10)
+                if img_resp.status_code != 200:
+                    continue
+                data = img_resp.content
+                images.append({
+                    'src': img_url,
+                    'alt': img.get('alt', ''),
+                    'data': data,
+                    'ocr_text': self.ocr_image(data),
+                })
+            except Exception as e:
+                print(f"  ✗ Image failed {img_url}: {e}")
+        entry['images'] = images
+
+    def ocr_image(self, image_data):
+        """Preprocess and OCR one image's bytes."""
+        try:
+            image = Image.open(BytesIO(image_data)).convert('RGB')
+            array = np.asarray(image, dtype=np.uint8)
+            processed = _preprocess(array)
+            return pytesseract.image_to_string(Image.fromarray(processed)).strip()
+        except Exception:
+            return ''
+
+    def extract_all_content(self):
+        self.extract_all_text()
+        for url, entry in self.text_content.items():
+            self._fetch_images(entry)
+            self.images_info[url] = entry.get('images', [])
+        return self.text_content
+
+
+class DocumentManager:
+    """JSON-file store for plain-text extraction documents."""
+
+    def __init__(self, storage_path='text_documents.json'):
+        self.storage_path = Path(storage_path)
+        # Bumped on every mutation so callers can skip stale refreshes.
+        self.version = 0
+        # (mtime_ns, docs) of the last parse; a matching mtime skips
+        # the disk read and JSON parse entirely.
+        self._cache = None
+
+    def load(self):
+        if not self.storage_path.exists():
+            return {}
+        stat = self.storage_path.stat()
+        if stat.st_size == 0:
+            return {}
+        if self._cache is not None and self._cache[0] == stat.st_mtime_ns:
+            return self._cache[1]
+        with open(self.storage_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if orjson is not None:
+                    docs = orjson.loads(memoryview(mm))
+                else:
+                    docs = json.loads(mm[:].decode('utf-8'))
+            finally:
+                mm.close()
+        self._cache = (stat.st_mtime_ns, docs)
+        return docs
+
+    def save(self, docs):
+        if orjson is not None:
+            payload = orjson.dumps(docs, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(docs, ensure_ascii=False,
+                                 indent=2).encode('utf-8')
+        # Write to a temp file and swap so readers never see a torn store.
+        fd, tmp_path = tempfile.mkstemp(dir=self.storage_path.parent,
+                                        prefix=self.storage_path.name,
+                                        suffix='.tmp')
+        try:
+            # One raw write(2) of the whole payload; no buffer layer to
+            # copy multi-MB documents through.
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.storage_path)
+            self._cache = (self.storage_path.stat().st_mtime_ns, docs)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def add_document(self, doc_id, url, title, content):
+        docs = self.load()
+        docs[doc_id] = {
+            'url': url,
+            'title': title,
+            'content': content,
+            'created_at': datetime.now().isoformat(),
+        }
+        self.save(docs)
+        self.version += 1
+
+    def delete_document(self, doc_id):
+        docs = self.load()
+        if doc_id in docs:
+            del docs[doc_id]
+            self.save(docs)
+            self.version += 1
+
+    def list_documents(self):
+        docs = self.load()
+        return [
+            {'id': doc_id,
+             'title': doc.get('title', ''),
+             'created_at': doc.get('created_at', ''),
+             'url': doc.get('url', '')}
+            for doc_id, doc in docs.items()
+        ]
+
+    def get_document(self, doc_id):
+        return self.load().get(doc_id)
+
+
+class MultimodalDocumentManager(DocumentManager):
+    """JSON store plus an images directory for multimodal documents."""
+
+    def __init__(self, storage_path='multimodal_documents.json',
+                 images_dir='multimodal_images'):
+        super().__init__(storage_path)
+        self.images_dir = Path(images_dir)
+
+    def add_document(self, doc_id, url, title, content, images_info):
+        os.makedirs(self.images_dir, exist_ok=True)
+        saved_images = []
+        for i, img in enumerate(images_info):
+            data = img.get('data')
+            if not data:
+                continue
+            ext = os.path.splitext(urlparse(img['src']).path)[1] or '.png'
+            filename = f'{doc_id}_{i:03d}{ext}'
+            path = self.images_dir / filename
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            saved_images.append({
+                'src': img['src'],
+                'alt': img.get('alt', ''),
+                'ocr_text': img.get('ocr_text', ''),
+                'path': str(path),
+            })
+
+        docs = self.load()
+        docs[doc_id] = {
+            'url': url,
+            'title': title,
+            'content': content,
+            'images': saved_images,
+            'created_at': datetime.now().isoformat(),
+        }
+        self.save(docs)
+        self.version += 1
+
+    def list_documents(self):
+        docs = self.load()
+        return [
+            {'id': doc_id,
+             'title': doc.get('title', ''),
+             'created_at': doc.get('created_at', ''),
+             'url': doc.get('url', ''),
+             'image_count': len(doc.get('images', []))}
+            for doc_id, doc in docs.items()
+        ]
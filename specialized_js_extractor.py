@@ -0,0 +1,342 @@
+"""Specialized extractor for heavily JS-rendered (Vue/React) sites.
+
+Uses Selenium to render each page, then digs the text out of the DOM
+tag by tag, including elements only reachable after scripts run.
+"""
+
+import atexit
+import concurrent.futures
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Class names that mark navigation/menu chrome; compiled once, applied
+# to every element of every page.
+_NAV_CLASS_RE = re.compile(r'(nav|menu|sidebar|breadcrumb)', re.I)
+
+# urljoin re-parses the base URL on every call; pages repeat the same
+# base and a handful of hrefs (nav, pagination) hundreds of times, so
+# caching turns most joins into a dict hit.
+@lru_cache(maxsize=8192)
+def _urljoin(base, href):
+    return urljoin(base, href)
+
+
+# Debounced DOM-quiet signal: window.__idle flips true once no
+# mutation has fired for 500ms after the latest arm.
+_IDLE_SETUP_JS = """
+if (!window.__armIdle) {
+    window.__idle = false;
+    let timer = null;
+    const mark = () => { window.__idle = true; };
+    const observer = new MutationObserver(() => {
+        window.__idle = false;
+        clearTimeout(timer);
+        timer = setTimeout(mark, 500);
+    });
+    observer.observe(document.documentElement,
+                     {childList: true, subtree: true, characterData: true});
+    window.__armIdle = () => {
+        window.__idle = false;
+        clearTimeout(timer);
+        timer = setTimeout(mark, 500);
+    };
+}
+window.__armIdle();
+"""
+
+# Harvest JS-only element text inside the browser: one script call
+# returns everything, instead of one WebDriver round trip per element.
+_DYNAMIC_TEXT_JS = """
+const out = [];
+for (const el of document.querySelectorAll(
+        '[data-v-app], [data-reactroot], #app *, #root *')) {
+    const text = el.innerText;
+    if (text && text.length > 10) out.push(text);
+}
+return out;
+"""
+
+# (bucket, min text length) per tag; -1 keeps even empty text,
+# matching the old unfiltered find_all buckets. Fixed table, built
+# once at import instead of per page.
+_TAG_BUCKETS = {
+    'h1': ('headings', 0), 'h2': ('headings', 0),
+    'h3': ('headings', 0), 'h4': ('headings', 0),
+    'h5': ('headings', 0), 'h6': ('headings', 0),
+    'p': ('paragraphs', 0),
+    'div': ('divs', 20),
+    'span': ('spans', 10),
+    'li': ('list_items', 0),
+    'table': ('tables', -1),
+    'ul': ('lists', -1), 'ol': ('lists', -1),
+    'article': ('articles', -1),
+    'section': ('sections', -1),
+    'button': ('buttons', 0),
+}
+
+_chromedriver_path = None
+
+
+def _resolve_chromedriver():
+    """Driver binary path, resolved once per process.
+
+    CHROMEDRIVER_PATH skips webdriver_manager entirely; otherwise its
+    install/version check runs a single time instead of per driver.
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = (os.environ.get('CHROMEDRIVER_PATH')
+                              or ChromeDriverManager().install())
+    return _chromedriver_path
+
+
+class _DriverPool:
+    """Process-wide pool of warmed headless Chrome drivers.
+
+    Chrome cold-starts cost seconds; pooling pays that once per slot
+    and reuses the browser across pages and extractor instances.
+    """
+
+    def __init__(self, size=2):
+        self.size = size
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_driver(self):
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        service = Service(_resolve_chromedriver())
+        return webdriver.Chrome(service=service, options=options)
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._new_driver()
+        # At capacity: wait for a driver to come back.
+        return self._idle.get()
+
+    def release(self, driver):
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        """Quit a broken driver and free its slot for a fresh one."""
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def shutdown(self):
+        while True:
+            try:
+                self._idle.get_nowait().quit()
+            except queue.Empty:
+                break
+            except Exception:
+                continue
+
+
+_driver_pool = _DriverPool()
+atexit.register(_driver_pool.shutdown)
+
+
+class SpecializedJSDynamicExtractor:
+    """Extracts content from JS-rendered pages one navigation at a time."""
+
+    def __init__(self, wait_time=10):
+        self.wait_time = wait_time
+        self.page_contents = {}
+        self.failed_urls = []
+        self.first_title = ''
+
+    def wait_for_render(self, driver):
+        """Let the framework render and lazy-load content.
+
+        Instead of fixed sleeps, wait for document readiness, then
+        scroll to the bottom and wait until DOM mutations go quiet for
+        500ms — twice, so content lazy-loaded by the first scroll gets
+        a chance to extend the page.
+        """
+        wait = WebDriverWait(driver, self.wait_time)
+        wait.until(lambda d: d.execute_script(
+            'return document.readyState') == 'complete')
+        for _ in range(2):
+            driver.execute_script(_IDLE_SETUP_JS)
+            driver.execute_script(
+                'window.scrollTo(0, document.body.scrollHeight)')
+            try:
+                wait.until(
+                    lambda d: d.execute_script('return window.__idle'))
+            except TimeoutException:
+                # Page never settles (tickers etc.); use what rendered.
+                break
+
+    def extract_content_from_page(self, url):
+        """Render one URL and pull everything interesting out of it."""
+        driver = _driver_pool.acquire()
+        try:
+            driver.get(url)
+            self.wait_for_render(driver)
+
+            # Text of JS-only elements straight from the live DOM
+            try:
+                dynamic_texts = driver.execute_script(_DYNAMIC_TEXT_JS) or []
+            except Exception:
+                dynamic_texts = []
+
+            html = driver.page_source
+        except Exception:
+            # The session may be wedged; don't put it back in the pool.
+            _driver_pool.discard(driver)
+            raise
+        else:
+            _driver_pool.release(driver)
+
+        # libxml2 parses the big rendered DOMs an order of magnitude
+        # faster than the pure-Python parser.
+        soup = BeautifulSoup(html, 'lxml')
+
+        content = {
+            'url': url,
+            'title': soup.title.string.strip() if soup.title and soup.title.string else '',
+            'extracted_at': datetime.now().isoformat(),
+            'dynamic_texts': dynamic_texts,
+        }
+
+        for bucket, _ in _TAG_BUCKETS.values():
+            content[bucket] = []
+        content['navigation'] = []
+        links = content['links'] = []
+        images = content['images'] = []
+
+        # One walk over the tree instead of a full recursive find_all
+        # per bucket; every tag is classified as it streams past.
+        # Handlers bind each tag straight to its bucket's append, so
+        # the per-node cost is one dict.get plus a C-level append.
+        handlers = {name: (content[bucket].append, min_len)
+                    for name, (bucket, min_len) in _TAG_BUCKETS.items()}
+        nav_search = _NAV_CLASS_RE.search
+        root = soup.body or soup
+        text_chunks = []
+        for el in root.descendants:
+            name = el.name
+            if name is None:
+                # Text node: fold it into the full-page text here so no
+                # separate get_text pass has to re-walk the tree.
+                if (not isinstance(el, Comment)
+                        and el.parent.name not in ('script', 'style',
+                                                   'noscript')):
+                    chunk = el.strip()
+                    if chunk:
+                        text_chunks.append(chunk)
+                continue
+            if name == 'a':
+                href = el.get('href')
+                if href:
+                    links.append({'text': el.get_text(strip=True),
+                                  'href': _urljoin(url, href)})
+            elif name == 'img':
+                src = el.get('src')
+                if src:
+                    images.append({'src': _urljoin(url, src),
+                                   'alt': el.get('alt', '')})
+            else:
+                spec = handlers.get(name)
+                if spec is not None:
+                    append_text, min_len = spec
+                    text = el.get_text(strip=True)
+                    if min_len < 0 or len(text) > min_len:
+                        append_text(text)
+            # Navigation/menu blocks, matched by class name on any tag
+            classes = el.get('class')
+            if classes and nav_search(' '.join(classes)):
+                text = el.get_text(strip=True)
+                if text:
+                    content['navigation'].append(text)
+
+        content['full_text'] = '\n'.join(text_chunks)
+
+        return content
+
+    def extract_all_content(self, urls, max_concurrency=4):
+        """Extract every URL, fanning out across the pooled drivers.
+
+        Concurrency is bounded both by `max_concurrency` and by the
+        driver pool size (workers block in acquire), so a batch runs in
+        roughly max-latency instead of sum-latency time.
+        """
+        if not urls:
+            return self.page_contents
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(urls))) as pool:
+            futures = {pool.submit(self.extract_content_from_page, url): url
+                       for url in urls}
+            for future in concurrent.futures.as_completed(futures):
+                url = futures[future]
+                try:
+                    self.page_contents[url] = future.result()
+                    print(f"  ✓ Extracted {url}")
+                except Exception as e:
+                    print(f"  ✗ Failed {url}: {e}")
+                    self.failed_urls.append(url)
+        for url in urls:
+            if self.first_title:
+                break
+            page = self.page_contents.get(url)
+            if page:
+                self.first_title = page['title']
+        return self.page_contents
+
+    def generate_detailed_report(self):
+        """Build a text report of everything extracted."""
+        parts = []
+        append = parts.append
+        append('=' * 80 + '\n')
+        append('SPECIALIZED JS-DYNAMIC EXTRACTION REPORT\n')
+        append(f'Generated: {datetime.now().isoformat()}\n')
+        append(f'Pages: {len(self.page_contents)}\n')
+        append('=' * 80 + '\n\n')
+
+        for url, page in self.page_contents.items():
+            append('-' * 80 + '\n')
+            append(f'PAGE: {url}\n')
+            append(f'TITLE: {page["title"]}\n\n')
+            for bucket in ('headings', 'paragraphs', 'dynamic_texts',
+                           'list_items', 'navigation', 'buttons'):
+                items = page.get(bucket, [])
+                if not items:
+                    continue
+                append(f'{bucket.upper()}:\n')
+                for item in items:
+                    append(f'  {item}\n')
+                append('\n')
+            append(f'LINKS: {len(page.get("links", []))}\n')
+            append(f'IMAGES: {len(page.get("images", []))}\n\n')
+
+        if self.failed_urls:
+            append('FAILED URLS:\n')
+            for url in self.failed_urls:
+                append(f'  {url}\n')
+        return ''.join(parts)
@@ -0,0 +1,287 @@
+"""Background monitoring services for Xiaohongshu keywords.
+
+The services run their loops on worker threads and report back to the
+GUI exclusively through callbacks (status, progress, results, logs).
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from enum import Enum
+from functools import lru_cache
+
+import aiohttp
+
+from xiaohongshu_scraper import XiaohongshuScraper, XiaohongshuScraperConfig
+
+# The search page inlines its store as a JS assignment; the feed items
+# inside match the search API's shape, so the scraper's normalizer can
+# be reused on them directly.
+_INITIAL_STATE_RE = re.compile(
+    r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\})\s*</script>', re.S)
+
+
+class MonitoringStatus(Enum):
+    IDLE = 'idle'
+    RUNNING = 'running'
+    STOPPING = 'stopping'
+    STOPPED = 'stopped'
+    ERROR = 'error'
+
+
+@lru_cache(maxsize=None)  # finite domain: enum x small keyword counts
+def format_status_message(status, keyword_count=0):
+    """Human-readable status line for the GUI status label."""
+    if status == MonitoringStatus.IDLE:
+        return 'Monitoring idle'
+    if status == MonitoringStatus.RUNNING:
+        return f'Monitoring {keyword_count} keyword(s)...'
+    if status == MonitoringStatus.STOPPING:
+        return 'Stopping monitoring...'
+    if status == MonitoringStatus.STOPPED:
+        return 'Monitoring stopped'
+    return 'Monitoring error'
+
+
+@lru_cache(maxsize=256)
+def format_progress_message(current, total):
+    """Human-readable progress line for the GUI progress label."""
+    if total <= 0:
+        return ''
+    return f'Processed {current}/{total} keywords'
+
+
+class XiaohongshuMonitoringService:
+    """Periodically scrapes a keyword list and pushes results back."""
+
+    def __init__(self, interval_seconds=300):
+        self.interval_seconds = interval_seconds
+        self.status = MonitoringStatus.IDLE
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.on_status_change = None
+        self.on_progress = None
+        self.on_results = None
+        self.on_log = None
+        # One scraper reused across keywords and cycles; it is
+        # stateless per request, so sharing it is safe and keeps its
+        # pooled connections warm between runs.
+        self._scraper = None
+
+    def _set_status(self, status, keyword_count=0):
+        self.status = status
+        if self.on_status_change:
+            self.on_status_change(status, keyword_count)
+
+    def _log(self, message, level='info'):
+        if self.on_log:
+            self.on_log(message, level)
+
+    def start(self, keywords, period_days=7):
+        if self.status == MonitoringStatus.RUNNING:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(list(keywords), period_days), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self.status != MonitoringStatus.RUNNING:
+            return
+        self._set_status(MonitoringStatus.STOPPING)
+        self._stop_event.set()
+
+    async def _scrape_with_backoff(self, scraper, session, keyword,
+                                   period_days, max_attempts=3):
+        """Retry transient failures with exponential backoff + jitter.
+
+        A 429's Retry-After header, when present, overrides the
+        exponential schedule. Only the affected keyword waits; the
+        others keep running on the event loop.
+        """
+        for attempt in range(max_attempts):
+            try:
+                return await scraper.scrape_keyword_async(
+                    session, keyword, period_days)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == max_attempts - 1:
+                    raise
+                delay = min(60, 2 ** attempt) + random.uniform(0, 1)
+                headers = getattr(e, 'headers', None)
+                retry_after = headers.get('Retry-After') if headers else None
+                if retry_after:
+                    try:
+                        delay = min(60, float(retry_after))
+                    except ValueError:
+                        pass
+                self._log(f'{keyword}: attempt {attempt + 1} failed '
+                          f'({e}), retrying in {delay:.1f}s', 'warning')
+                await asyncio.sleep(delay)
+
+    async def _scrape_cycle(self, keywords, period_days):
+        """Fetch every keyword concurrently over one shared session.
+
+        A single event loop with keep-alive pooling replaces the thread
+        fan-out: connections are reused across keywords and pages, and
+        the semaphore keeps in-flight requests polite.
+        """
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=4,
+                                         keepalive_timeout=30)
+        sem = asyncio.Semaphore(4)
+        all_posts = []
+        done = 0
+        if self._scraper is None:
+            self._scraper = XiaohongshuScraper(XiaohongshuScraperConfig())
+        scraper = self._scraper
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            async def scrape_one(keyword):
+                async with sem:
+                    if self._stop_event.is_set():
+                        return keyword, []
+                    self._log(f'Scraping keyword: {keyword}')
+                    posts = await self._scrape_with_backoff(
+                        scraper, session, keyword, period_days)
+                    return keyword, posts
+
+            tasks = [asyncio.ensure_future(scrape_one(kw)) for kw in keywords]
+            for task in asyncio.as_completed(tasks):
+                try:
+                    keyword, posts = await task
+                    all_posts.extend(posts)
+                    self._log(f'{keyword}: {len(posts)} posts', 'success')
+                except Exception as e:
+                    self._log(f'keyword failed: {e}', 'error')
+                done += 1
+                if self.on_progress:
+                    self.on_progress(done, len(keywords))
+        return all_posts
+
+    def _run(self, keywords, period_days):
+        self._set_status(MonitoringStatus.RUNNING, len(keywords))
+        # One loop for the lifetime of the monitor thread; cycles reuse
+        # its selector and executor instead of paying asyncio.run's
+        # create/teardown every interval.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while not self._stop_event.is_set():
+                all_posts = loop.run_until_complete(
+                    self._scrape_cycle(keywords, period_days))
+                if all_posts and self.on_results:
+                    self.on_results(all_posts)
+                self._stop_event.wait(self.interval_seconds)
+        except Exception as e:
+            self._log(f'Monitoring crashed: {e}', 'error')
+            self._set_status(MonitoringStatus.ERROR)
+            return
+        finally:
+            loop.close()
+        self._set_status(MonitoringStatus.STOPPED)
+
+
+class XiaohongshuBrowserMonitor:
+    """Drives a logged-in browser session to watch keyword feeds."""
+
+    def __init__(self, account=None, headless=True):
+        self.account = account
+        self.headless = headless
+        self.driver = None
+
+    def start(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = Options()
+        if self.headless:
+            options.add_argument('--headless=new')
+        service = Service(ChromeDriverManager().install())
+        self.driver = webdriver.Chrome(service=service, options=options)
+
+    def fetch_keyword(self, keyword):
+        if self.driver is None:
+            self.start()
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        self.driver.get(
+            f'https://www.xiaohongshu.com/search_result?keyword={keyword}')
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script(
+                    'return document.readyState === "complete"'
+                    ' && !!window.__INITIAL_STATE__'))
+        except TimeoutException:
+            pass  # return whatever rendered
+        return self.driver.page_source
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+
+class XiaohongshuBrowserMonitorService(XiaohongshuMonitoringService):
+    """Monitoring service variant backed by a real browser session."""
+
+    def __init__(self, interval_seconds=300, account=None):
+        super().__init__(interval_seconds)
+        self.account = account
+        self.monitor = None
+
+    def _parse_results(self, html, keyword, period_days):
+        """Normalize posts out of a rendered search page.
+
+        The inlined __INITIAL_STATE__ feed items carry the same fields
+        as the search API's, so the scraper's normalizer turns them
+        into the post dicts the GUI's diffing table expects.
+        """
+        match = _INITIAL_STATE_RE.search(html)
+        if not match:
+            return []
+        try:
+            state = json.loads(match.group(1).replace('undefined', 'null'))
+        except ValueError:
+            return []
+        feeds = state.get('search', {}).get('feeds', [])
+        if isinstance(feeds, dict):
+            feeds = feeds.get('value') or []
+        if self._scraper is None:
+            self._scraper = XiaohongshuScraper(XiaohongshuScraperConfig())
+        posts = []
+        cutoff = time.time() - period_days * 86400
+        self._scraper._collect_items(feeds, cutoff, keyword, posts)
+        return posts
+
+    def _run(self, keywords, period_days):
+        self._set_status(MonitoringStatus.RUNNING, len(keywords))
+        self.monitor = XiaohongshuBrowserMonitor(account=self.account)
+        try:
+            while not self._stop_event.is_set():
+                all_posts = []
+                for i, keyword in enumerate(keywords):
+                    if self._stop_event.is_set():
+                        break
+                    self._log(f'Browser check: {keyword}')
+                    try:
+                        html = self.monitor.fetch_keyword(keyword)
+                        posts = self._parse_results(html, keyword,
+                                                    period_days)
+                        all_posts.extend(posts)
+                        self._log(f'{keyword}: {len(posts)} posts',
+                                  'success')
+                    except Exception as e:
+                        self._log(f'{keyword} failed: {e}', 'error')
+                    if self.on_progress:
+                        self.on_progress(i + 1, len(keywords))
+                if all_posts and self.on_results:
+                    self.on_results(all_posts)
+                self._stop_event.wait(self.interval_seconds)
+        finally:
+            self.monitor.close()
+        self._set_status(MonitoringStatus.STOPPED)
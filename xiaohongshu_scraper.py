@@ -0,0 +1,136 @@
+"""Xiaohongshu (XHS) keyword scraper.
+
+Fetches recent posts for a keyword through the web search endpoint and
+normalizes them into plain dicts for the monitoring services and GUI.
+Both a synchronous (requests) and an asynchronous (aiohttp) fetch path
+are provided; the monitoring service uses the async one.
+"""
+
+import json
+import time
+
+import aiohttp
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Parse through orjson when available; the search payloads are large
+# enough that the C parser is a measurable win per page.
+try:
+    import orjson as _orjson
+
+    json_loads = _orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+SEARCH_URL = 'https://edith.xiaohongshu.com/api/sns/web/v1/search/notes'
+
+_USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+               'AppleWebKit/537.36 (KHTML, like Gecko) '
+               'Chrome/120.0 Safari/537.36')
+
+
+class XiaohongshuScraperConfig:
+    """Connection/behaviour knobs for the scraper."""
+
+    def __init__(self, timeout=15, page_size=20, max_pages=3,
+                 request_interval=1.0, cookie=''):
+        self.timeout = timeout
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.request_interval = request_interval
+        self.cookie = cookie
+
+
+class XiaohongshuScraper:
+    """Scrapes XHS search results for one keyword at a time."""
+
+    def __init__(self, config=None):
+        self.config = config or XiaohongshuScraperConfig()
+        self.headers = {
+            'User-Agent': _USER_AGENT,
+            'Cookie': self.config.cookie,
+        }
+        # Keep-alive pooling: reusing connections across pages and
+        # keywords skips the TCP/TLS handshake on every request.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504]))
+        self.session.mount('https://', adapter)
+
+    def _search_body(self, keyword, page):
+        return {'keyword': keyword, 'page': page,
+                'page_size': self.config.page_size,
+                'sort': 'time_descending'}
+
+    def _collect_items(self, items, cutoff, keyword, posts):
+        """Normalize raw search items into post dicts, honouring cutoff."""
+        for item in items:
+            note = item.get('note_card') or item.get('note') or {}
+            user = note.get('user', {})
+            interact = note.get('interact_info', {})
+            timestamp = note.get('time', 0) / 1000 if note.get('time') else 0
+            if timestamp and timestamp < cutoff:
+                continue
+            posts.append({
+                'note_id': item.get('id', ''),
+                'title': note.get('display_title', ''),
+                'author': {'nickname': user.get('nickname', ''),
+                           'user_id': user.get('user_id', '')},
+                'likes': int(interact.get('liked_count') or 0),
+                'comments': int(interact.get('comment_count') or 0),
+                'url': f"https://www.xiaohongshu.com/explore/{item.get('id', '')}",
+                'timestamp': timestamp,
+                'keyword': keyword,
+            })
+
+    def scrape_keyword(self, keyword, period_days=7):
+        """Return a list of post dicts for `keyword`.
+
+        Each post has: note_id, title, author {nickname, user_id},
+        likes, comments, url, timestamp.
+        """
+        posts = []
+        cutoff = time.time() - period_days * 86400
+        for page in range(1, self.config.max_pages + 1):
+            response = self.session.post(
+                SEARCH_URL,
+                json=self._search_body(keyword, page),
+                timeout=self.config.timeout)
+            if response.status_code != 200:
+                break
+            payload = json_loads(response.content)
+            items = payload.get('data', {}).get('items', [])
+            if not items:
+                break
+            self._collect_items(items, cutoff, keyword, posts)
+            time.sleep(self.config.request_interval)
+        return posts
+
+    async def scrape_keyword_async(self, session, keyword, period_days=7):
+        """Async variant of scrape_keyword sharing an aiohttp session."""
+        posts = []
+        cutoff = time.time() - period_days * 86400
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        for page in range(1, self.config.max_pages + 1):
+            async with session.post(
+                    SEARCH_URL,
+                    json=self._search_body(keyword, page),
+                    headers=self.headers,
+                    timeout=timeout) as response:
+                if response.status == 429:
+                    # Surface rate limiting so callers can back off.
+                    response.raise_for_status()
+                if response.status != 200:
+                    break
+                payload = json_loads(await response.read())
+            items = payload.get('data', {}).get('items', [])
+            if not items:
+                break
+            self._collect_items(items, cutoff, keyword, posts)
+            await asyncio.sleep(self.config.request_interval)
+        return posts